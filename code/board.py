@@ -5,77 +5,106 @@ from string import *
 import numpy as np
 from hexTile import *
 from hexLib import *
+from boardTopology import *
+from boardGenerator import *
+from zobristHash import *
 from player import *
+import logging
 #import networkx as nx
 #import matplotlib.pyplot as plt
-import pygame
 
-pygame.init()
+logger = logging.getLogger('catan.board')
 
 #Class to implement Catan board logic
 #Use a graph representation for the board
-class catanBoard(hexTile, Vertex):
+class catanBoard(hexTile):
     'Class Definition for Catan Board Logic'
     #Object Creation - creates a random board configuration with hexTiles
-    def __init__(self):
+    #seed can be an int, a numpy SeedSequence (e.g. spawned for one game of a batch) or None for a fresh random game
+    def __init__(self, seed=345678765):
         # DYLAN: Added in np seeding random for testing
 
-        # np.random.seed(12512312)
-        # np.random.seed(123414214)
-        # np.random.seed(90812735)
-
-        # np.random.seed(15444412) # kind of good for showing initial placements if i go last
-        # np.random.seed(12384524) # exmaple where first position chooses one settlement over another because of resource diversity
-        # np.random.seed(9185751) # triple wheat - example where cranking wheat up and resource diversity down can get different playstyles
-        # np.random.seed(1239834345) # was able to win in 3rd position
-        # np.random.seed(121444897) # double ore / ore port. first position places interestingly for its second settlement on one resource # own the game in 4th position
-        np.random.seed(345678765) # got clobbered by ai on this one in 4th position
-    
+        # seed=12512312
+        # seed=123414214
+        # seed=90812735
 
+        # seed=15444412 # kind of good for showing initial placements if i go last
+        # seed=12384524 # exmaple where first position chooses one settlement over another because of resource diversity
+        # seed=9185751 # triple wheat - example where cranking wheat up and resource diversity down can get different playstyles
+        # seed=1239834345 # was able to win in 3rd position
+        # seed=121444897 # double ore / ore port. first position places interestingly for its second settlement on one resource # own the game in 4th position
+        # seed=345678765 # got clobbered by ai on this one in 4th position
 
+        #Random number generator of this game - every random draw in the game comes from here
+        self.rng = np.random.default_rng(seed)
 
         self.hexTileDict = {} #Dict to store all hextiles, with hexIndex as key
-        self.vertex_index_to_pixel_dict = {} #Dict to store the Vertices coordinates with vertex indices as keys
-        self.boardGraph = {} #Dict to store the vertex objects with the pixelCoordinates as keys
+
+        #Hexes, vertices, edges and ports are the same on every board - use the shared topology
+        self.topology = standardTopology
 
         self.edgeLength = 80 #Specify for hex size
         self.size = self.width, self.height = 1000, 800
-        self.flat = Layout(layout_flat, Point(self.edgeLength, self.edgeLength), Point(self.width/2, self.height/2)) #specify Layout
+        self.flat = self.topology.layout #specify Layout
 
         ##INITIALIZE BOARD##
-        print("Initializing Catan Game Board...")
-        self.resourcesList = self.getRandomResourceList() #Assign resources numbers randomly
-
-        #Get a random permutation of indices 0-18 to use with the resource list
-        randomIndices = np.random.permutation([i for i in range(len(self.resourcesList))])
-        
-        reinitializeCount = 0
-        #Initialize a valid resource list that does not allow adjacent 6's and 8's
-        while(self.checkHexNeighbors(randomIndices) == False):
-            reinitializeCount += 1
-            randomIndices = np.random.permutation([i for i in range(len(self.resourcesList))])
-
-        print("Re-initialized random board {} times".format(reinitializeCount))
-        
-        hexIndex_i = 0 #initialize hexIndex at 0
-        #Neighbors are specified in adjacency matrix - hard coded
+        logger.info("Initializing Catan Game Board...")
+        #Place the resources and numbers directly so that no 6's and 8's are adjacent
+        resourceLayout, numberLayout = generate_layout(self.rng)
         
-        #Generate the hexes and the graphs with the Index, Centers and Resources defined
-        for rand_i in randomIndices:
+        #Generate the hexes with the Index, Centers and Resources defined
+        for hexIndex_i in range(self.topology.numHexes):
             #Get the coordinates of the new hex, indexed by hexIndex_i
             hexCoords = self.getHexCoords(hexIndex_i)
 
-            #Create the new hexTile with index and append + increment index
-            newHexTile = hexTile(hexIndex_i, self.resourcesList[rand_i], hexCoords)
+            resourceType = resourceTypes[resourceLayout[hexIndex_i]]
+            if(resourceType == 'DESERT'):
+                hexResource = Resource(resourceType, None)
+            else:
+                hexResource = Resource(resourceType, int(numberLayout[hexIndex_i]))
+
+            #Create the new hexTile with index
+            newHexTile = hexTile(hexIndex_i, hexResource, hexCoords)
             if(newHexTile.resource.type == 'DESERT'): #Initialize robber on Desert
                 newHexTile.robber = True
+                self.robberHex = hexIndex_i #hexIndex of the tile with the robber
 
             self.hexTileDict[hexIndex_i] = newHexTile
-            hexIndex_i += 1
 
-        #Create the vertex graph
-        self.vertexIndexCount = 0 #initialize vertex index count to 0
-        self.generateVertexGraph()
+        #Legal robber spots - every hex but the one the robber is on, kept up to date as the robber moves
+        self.robberSpots = {indx: hex_tile for indx, hex_tile in self.hexTileDict.items() if indx != self.robberHex}
+
+        #Zobrist hash of the robber, buildings and roads, updated with every change to the board
+        self.zobristHash = robberKeys[self.robberHex]
+
+        #Per game state of the board, indexed by vertex or edge index
+        self.vertexOwner = [None] * self.topology.numVertices #Player with a settlement or city on each vertex
+        self.vertexBuilding = [0] * self.topology.numVertices #0 - empty, 1 - settlement, 2 - city
+        self.vertexPort = [False] * self.topology.numVertices #Port type on each vertex
+        self.edgeOwner = [None] * self.topology.numEdges #Player with a road on each edge
+
+        #Production index, kept up to date as settlements, cities and the robber are placed
+        self.hexProduction = [{} for hexIndex in range(self.topology.numHexes)] #Dict of player - number of resources (1 per settlement, 2 per city) on each hex
+        self.rollProduction = {diceNum: {} for diceNum in range(2, 13)} #Dict of player - {resource: amount} collected for each dice roll, robber hex excluded
+
+        #Bitboard occupancy - python ints with bit v set for vertex v, or bit e for edge e
+        self.occupiedMask = 0 #Vertices with a settlement or city
+        self.blockedMask = 0 #Vertices with a settlement or city on or next to them
+        self.settlementMask = {} #Dict of player - vertices with the player's settlements
+        self.cityMask = {} #Dict of player - vertices with the player's cities
+        self.roadMask = {} #Dict of player - edges with the player's roads
+        self.roadVertexMask = {} #Dict of player - vertices at the end of one of the player's roads
+
+        #Legal move frontiers, kept up to date as roads, settlements and cities are placed or removed
+        self.roadVertexCount = {} #Dict of player - number of the player's roads at each vertex
+        self.potentialRoadMask = {} #Dict of player - edges the player can build a road on
+        self.potentialCities = {} #Dict of player - settlements that can become cities, in the order they were built
+
+        #Journal of hypothetical actions that can be undone, latest last
+        self.journal = []
+
+        #Road networks of each player with their longest trails, see getRoadNetworkLengths
+        self.roadNetworkCache = {} #Dict of player - (roadMask, roadVertexMask, cutMask, [(networkMask, length), ...]) it was computed for
 
         self.updatePorts() #Add the ports to the graph
 
@@ -86,131 +115,26 @@ class catanBoard(hexTile, Vertex):
 
 
     def getHexCoords(self, hexInd):
-        #Dictionary to store Axial Coordinates (q, r) by hexIndex
-        coordDict = {0:Axial_Point(0,0), 1:Axial_Point(0,-1), 2:Axial_Point(1,-1), 3:Axial_Point(1,0), 4:Axial_Point(0,1), 5:Axial_Point(-1,1), 6:Axial_Point(-1,0), 7:Axial_Point(0,-2), 8:Axial_Point(1,-2), 9:Axial_Point(2,-2), 10:Axial_Point(2,-1),
-                        11:Axial_Point(2,0), 12:Axial_Point(1,1), 13:Axial_Point(0,2), 14:Axial_Point(-1,2), 15:Axial_Point(-2,2), 16:Axial_Point(-2,1), 17:Axial_Point(-2,0), 18:Axial_Point(-1,-1)}
-        return coordDict[hexInd]
-
-
-    #Function to generate a random permutation of resources
-    def getRandomResourceList(self):
-        #Define Resources as a dict
-        Resource_Dict = {'DESERT':1, 'ORE':3, 'BRICK':3, 'WHEAT':4, 'WOOD':4, 'SHEEP':4}
-        #Get a random permutation of the numbers
-        NumberList = np.random.permutation([2,3,3,4,4,5,5,6,6,8,8,9,9,10,10,11,11,12])
-        numIndex = 0
-
-        resourceList = [] 
-        for r in Resource_Dict.keys():
-            numberofResource = Resource_Dict[r]
-            if(r != 'DESERT'):
-                for n in range(numberofResource):
-                    resourceList.append(Resource(r, NumberList[numIndex]))
-                    numIndex += 1
-            else:
-                resourceList.append(Resource(r, None))
-
-        return resourceList
-
-    #Function to check neighboring hexTiles
-    #Takes a list of rnadom indices as an input, and the resource list
-    def checkHexNeighbors(self, randomIndices):
-        #store a list of neighbors as per the axial coordinate -> numeric indexing system
-        hexNeighborIndexList = {0: [1,2,3,4,5,6], 1: [0,2,6,7,8,18], 2: [0,1,3,8,9,10],
-                                   3: [0,2,4,10,11,12], 4: [0,3,5,12,13,14], 5: [0,4,6,14,15,16],
-                                   6: [0,1,5,16,17,18], 7: [1,8,18], 8: [1,2,7,9],
-                                   9: [2,8,10], 10: [2,3,9,11], 11: [3,10,12],
-                                   12: [3,4,11,13], 13: [4,12,14], 14: [4,5,13,15],
-                                   15: [5,14,16], 16: [5,6,15,17], 17: [6,16,18], 18: [1,6,7,17]}
-
-        #Check each position, random index pair for its resource roll value
-        for pos, random_Index in enumerate(randomIndices):
-            rollValueOnHex = self.resourcesList[random_Index].num
-
-            #Check each neighbor in the position and check if number is legal
-            for neighbor_index in hexNeighborIndexList[pos]:
-                rollValueOnNeighbor = self.resourcesList[randomIndices[neighbor_index]].num
-                if rollValueOnHex in [6,8] and rollValueOnNeighbor in [6,8]:
-                    return False
-
-        #Return true if it legal for all hexes
-        return True
-
-
-    #Function to generate the entire board graph
-    def generateVertexGraph(self):
-        for hexTile in self.hexTileDict.values():
-            hexTileCorners = polygon_corners(self.flat, hexTile.hex) #Get vertices of each hex
-            #Create vertex graph with this list of corners
-            self.updateVertexGraph(hexTileCorners, hexTile.index)
-
-        #Once all hexTiles have been added  get edges
-        self.updateGraphEdges()
-
-
-    #Function to update a graph of the board with each vertex as a node
-    def updateVertexGraph(self, vertexCoordList, hexIndx):
-        for v in vertexCoordList:
-            #Check if vertex already exists - update adjacentHexList if it does
-            if v in self.vertex_index_to_pixel_dict.values():
-                for existingVertex in self.boardGraph.keys():
-                    if(existingVertex == v):
-                        self.boardGraph[v].adjacentHexList.append(hexIndx)
-
-            else:#Create new vertex if it doesn't exist
-                #print('Adding Vertex:', v)
-                newVertex = Vertex(v, hexIndx, self.vertexIndexCount)
-                self.vertex_index_to_pixel_dict[self.vertexIndexCount] = v #Create the index-pixel key value pair
-                self.boardGraph[v] = newVertex
-                self.vertexIndexCount += 1 #Increment index for future
-
-    
-    #Function to add adges to graph given all vertices
-    def updateGraphEdges(self):
-        for v1 in self.boardGraph.keys():
-            for v2 in self.boardGraph.keys():
-                if(self.vertexDistance(v1, v2) == self.edgeLength):
-                    self.boardGraph[v1].edgeList.append(v2)
+        #Axial Coordinates (q, r) by hexIndex
+        return self.topology.hexCoordList[hexInd]
 
 
-    @staticmethod
-    def vertexDistance(v1, v2):
-        dist = ((v1.x - v2.x)**2 + (v1.y - v2.y)**2)**0.5
-        return round(dist)
-
     #View the board graph info
     def printGraph(self):
-        print(len(self.boardGraph))
-        for node in self.boardGraph.keys():
-            print("Pixel:{}, Index:{}, NeighborVertexCount:{}, AdjacentHexes:{}".format(node, self.boardGraph[node].vertexIndex, len(self.boardGraph[node].edgeList), self.boardGraph[node].adjacentHexList))
+        self.topology.printTopology()
 
     #Update Board vertices with Port info
     def updatePorts(self):
         #list of vertex indices of all port pairs
-        port_pair_list = [[43,44], [33,34], [45,49], [27,53], [24,29], [30,31], [36,39], [41,42], [51,52]]
-
-        #Get a random permutation of indices of ports
-        randomPortIndices = np.random.permutation([i for i in range(len(port_pair_list))])
-        randomPortIndex_counter = 0
-
-        #Initialize port dictionary with counts
-        #Also use this dictionary to map vertex indices to specific ports as per the game board 
-        port_dict = {'2:1 BRICK':1, '2:1 SHEEP':1, '2:1 WOOD':1, '2:1 WHEAT':1, '2:1 ORE':1, '3:1 PORT':4}
+        port_pair_list = self.topology.portVertexPairs
 
-        #Assign random port vertex pairs for each port type
-        for portType, portVertexPair_count in port_dict.items():
-            portVertices = []
-            for i in range(portVertexPair_count): #Number of ports to assign
-                portVertices += port_pair_list[randomPortIndices[randomPortIndex_counter]] #Add randomized port
-                randomPortIndex_counter += 1
-
-            port_dict[portType] = portVertices
+        #Get a random port type for each port pair
+        portLayout = generate_ports(self.rng)
 
         #Iterate thru each port and update vertex info
-        for portType, portVertexIndex_list in port_dict.items():
-            for v_index in portVertexIndex_list: #Each vertex
-                vertexPixel = self.vertex_index_to_pixel_dict[v_index] #Get the pixel coordinates to update the boardgraph
-                self.boardGraph[vertexPixel].port = portType #Update the port type
+        for portIndex, portVertexPair in enumerate(port_pair_list):
+            for v_index in portVertexPair: #Each vertex
+                self.vertexPort[v_index] = portTypes[portLayout[portIndex]] #Update the port type
 
     
     #Function to Display Catan Board Info
@@ -220,81 +144,29 @@ class catanBoard(hexTile, Vertex):
         return None
 
     #Function to get the list of potential roads a player can build.
-    #Return these roads as a dictionary where key=vertex coordinates and values is the rect
+    #Return these roads as a dictionary where key=edge index and values is the rect
     def get_potential_roads(self, player):
-        colonisableRoads = {}
-        #Check potential roads from each road the player already has
-        for existingRoad in player.buildGraph['ROADS']:
-            for vertex_i in existingRoad: #Iterate over both vertices of this road
-                #Check neighbors from this vertex
-                for indx, v_i in enumerate(self.boardGraph[vertex_i].edgeList):
-                    if((self.boardGraph[vertex_i].edgeState[indx][1] == False) and (self.boardGraph[vertex_i].state['Player'] in [None, player])): #Edge currently does not have a road and vertex isn't colonised by another player
-                        if((v_i, vertex_i) not in colonisableRoads.keys() and (vertex_i, v_i) not in colonisableRoads.keys()): #If the edge isn't already there in both its regular + opposite orientation
-                            #Use boolean to keep track of potential roads
-                            colonisableRoads[(vertex_i, v_i)] = True
-                            #print(vertex_i, v_i)
-
-        return colonisableRoads
+        self.addPlayerFrontier(player)
+        return {edge: True for edge in maskIndices(self.potentialRoadMask[player])}
 
     
     #Function to get available settlements for colonisation for a particular player
     #Return these settlements as a dict of vertices with their Rects
     def get_potential_settlements(self, player):
-        colonisableVertices = {}
-        #Check starting from each road the player already has
-        for existingRoad in player.buildGraph['ROADS']:
-            for vertex_i in existingRoad: #Iterate over both vertices of this road
-                #Check if vertex isn't already in the potential settlements - to remove double checks
-                if(vertex_i not in colonisableVertices.keys()):
-                    if(self.boardGraph[vertex_i].isColonised): #Check if this vertex is already colonised
-                        break
-                    
-                    canColonise = True
-                    for v_neighbor in self.boardGraph[vertex_i].edgeList: #Check each of the neighbors from this vertex
-                        if(self.boardGraph[v_neighbor].isColonised):
-                            canColonise = False
-                            break
-                    
-                #If all checks are good add this vertex and its rect as the value
-                if(canColonise):
-                    #colonisableVertices[vertex_i] = self.draw_possible_settlement(vertex_i, player.color)
-                    colonisableVertices[vertex_i] = True
-
-        return colonisableVertices
+        self.addPlayerFrontier(player)
+        #Any vertex at the end of one of the player's roads that is not too close to a settlement
+        return {vertex: True for vertex in maskIndices(self.roadVertexMask[player] & ~self.blockedMask)}
 
 
     #Function to get available cities for colonisation for a particular player
     #Return these cities as a dict of vertex-vertexRect key value pairs
     def get_potential_cities(self, player):
-        colonisableVertices = {}
-        #Check starting from each settlement the player already has
-        for existingSettlement in player.buildGraph['SETTLEMENTS']:
-            #colonisableVertices[existingSettlement] = self.draw_possible_city(existingSettlement, player.color)
-            colonisableVertices[existingSettlement] = True
-
-        return colonisableVertices
+        self.addPlayerFrontier(player)
+        return dict(self.potentialCities[player])
 
     #Special function to get potential first settlements during setup phase
     def get_setup_settlements(self, player):
-        colonisableVertices = {}
-        #Check every vertex and every neighbor of that vertex, amd if both are open then we can build a settlement there
-        for vertexCoord in self.boardGraph.keys():
-            canColonise = True
-            potentialVertex = self.boardGraph[vertexCoord]
-            if(potentialVertex.isColonised):  #First check if vertex is colonised
-                canColonise = False
-            
-            #Check each neighbor
-            for v_neighbor in potentialVertex.edgeList:
-                if(self.boardGraph[v_neighbor].isColonised):  #Check if any of first neighbors are colonised
-                    canColonise = False
-                    break
-
-            if(canColonise): #If the vertex is colonisable add it to the dict with its Rect
-                #colonisableVertices[vertexCoord] = self.draw_possible_settlement(vertexCoord, player.color)
-                colonisableVertices[vertexCoord] = True
-
-        return colonisableVertices
+        return {vertex: True for vertex in maskIndices(self.topology.allVerticesMask & ~self.blockedMask)}
 
 
     #Special function to get potential first roads during setup phase
@@ -302,107 +174,438 @@ class catanBoard(hexTile, Vertex):
         colonisableRoads = {}
         #Can only build roads next to the latest existing player settlement
         latestSettlementCoords = player.buildGraph['SETTLEMENTS'][-1]
-        for v_neighbor in self.boardGraph[latestSettlementCoords].edgeList:
-            possibleRoad = (latestSettlementCoords, v_neighbor)
+        for possibleRoad in self.topology.vertexEdgeList[latestSettlementCoords]:
             #colonisableRoads[possibleRoad] = self.draw_possible_road(possibleRoad, player.color)
             colonisableRoads[possibleRoad] = True
         
         return colonisableRoads
 
     
-    #Function to update boardGraph with Road by player
-    def updateBoardGraph_road(self, v_coord1, v_coord2, player):
-        #Update edge from first vertex v1
-        for indx, v in enumerate(self.boardGraph[v_coord1].edgeList):
-            if(v == v_coord2):
-                self.boardGraph[v_coord1].edgeState[indx][0] = player
-                self.boardGraph[v_coord1].edgeState[indx][1] = True
-        
-        #Update edge from second vertex v2
-        for indx, v in enumerate(self.boardGraph[v_coord2].edgeList):
-            if(v == v_coord1):
-                self.boardGraph[v_coord2].edgeState[indx][0] = player
-                self.boardGraph[v_coord2].edgeState[indx][1] = True
-
-        #self.draw_road([v_coord1, v_coord2], player.color) #Draw the settlement
+    #Function to update boardGraph with Road on edge by player
+    def updateBoardGraph_road(self, edge, player):
+        self.edgeOwner[edge] = player
+        self.zobristHash ^= roadKeys[player.seat][edge]
+
+        #Nobody else can build on this edge now
+        for p in self.potentialRoadMask.keys():
+            self.potentialRoadMask[p] &= ~(1 << edge)
+
+        #Roads and settlements open up from the ends of the new road
+        self.addPlayerFrontier(player)
+        self.roadMask[player] |= 1 << edge
+        roadVertexCount = self.roadVertexCount[player]
+        for vertex in self.topology.edgeVertexList[edge]:
+            roadVertexCount[vertex] += 1
+            if(roadVertexCount[vertex] == 1):
+                self.roadVertexMask[player] |= 1 << vertex
+                if(self.vertexOwner[vertex] in [None, player]):
+                    for vertexEdge in self.topology.vertexEdgeList[vertex]:
+                        if(self.edgeOwner[vertexEdge] == None):
+                            self.potentialRoadMask[player] |= 1 << vertexEdge
+
+        #self.draw_road(edge, player.color) #Draw the road
 
     # DYLAN: added function to remove roads from board graph. this is only used because we add roads
     # to the board graph to check them in hypothetical situations
-    def remove_road_from_boardGraph(self, v_coord1, v_coord2):
-        #Update edge from first vertex v1
-        for indx, v in enumerate(self.boardGraph[v_coord1].edgeList):
-            if(v == v_coord2):
-                self.boardGraph[v_coord1].edgeState[indx][0] = None
-                self.boardGraph[v_coord1].edgeState[indx][1] = False
-        
-        #Update edge from second vertex v2
-        for indx, v in enumerate(self.boardGraph[v_coord2].edgeList):
-            if(v == v_coord1):
-                self.boardGraph[v_coord2].edgeState[indx][0] = None
-                self.boardGraph[v_coord2].edgeState[indx][1] = False
+    def remove_road_from_boardGraph(self, edge):
+        player = self.edgeOwner[edge]
+        self.edgeOwner[edge] = None
+        self.zobristHash ^= roadKeys[player.seat][edge]
+
+        #Undo what the road opened up for its owner
+        self.roadMask[player] &= ~(1 << edge)
+        roadVertexCount = self.roadVertexCount[player]
+        for vertex in self.topology.edgeVertexList[edge]:
+            roadVertexCount[vertex] -= 1
+            if(roadVertexCount[vertex] == 0):
+                self.roadVertexMask[player] &= ~(1 << vertex)
+                for vertexEdge in self.topology.vertexEdgeList[vertex]:
+                    self.updatePotentialRoad(vertexEdge, player)
+
+        #The edge is free again for every player that reaches it
+        for p in self.potentialRoadMask.keys():
+            self.updatePotentialRoad(edge, p)
 
         return
 
 
     #Function to update boardGraph with settlement on vertex v
-    def updateBoardGraph_settlement(self, v_coord, player):
-        self.boardGraph[v_coord].state['Player'] = player 
-        self.boardGraph[v_coord].state['Settlement'] = True
-        self.boardGraph[v_coord].isColonised = True 
-
-        #self.draw_settlement(v_coord, player.color) #Draw the settlement
+    def updateBoardGraph_settlement(self, v, player):
+        self.vertexOwner[v] = player
+        self.vertexBuilding[v] = 1
+        self.zobristHash ^= buildingKeys[player.seat][1][v]
+
+        #No settlements on or next to this vertex from now on
+        self.addPlayerFrontier(player)
+        self.potentialCities[player][v] = True
+        self.settlementMask[player] |= 1 << v
+        self.occupiedMask |= 1 << v
+        self.blockedMask |= self.topology.vertexClosedMasks[v]
+
+        #Other players can no longer build roads through this vertex
+        for p, roadVertexCount in self.roadVertexCount.items():
+            if(p != player and roadVertexCount[v] > 0):
+                for vertexEdge in self.topology.vertexEdgeList[v]:
+                    self.updatePotentialRoad(vertexEdge, p)
+
+        for adjacentHex in self.topology.vertexHexList[v]:
+            self.addHexProduction(adjacentHex, player, 1)
+
+        #self.draw_settlement(v, player.color) #Draw the settlement
     
     #Function to update boardGraph with settlement on vertex v
-    def updateBoardGraph_city(self, v_coord, player):
-        self.boardGraph[v_coord].state['Player'] = player 
-        self.boardGraph[v_coord].state['Settlement'] = False
-        self.boardGraph[v_coord].state['City'] = True
+    def updateBoardGraph_city(self, v, player):
+        self.vertexOwner[v] = player
+        self.vertexBuilding[v] = 2
+        self.zobristHash ^= buildingKeys[player.seat][1][v] ^ buildingKeys[player.seat][2][v]
+        del self.potentialCities[player][v]
+        self.settlementMask[player] &= ~(1 << v)
+        self.cityMask[player] |= 1 << v
+
+        #A city produces one more resource than the settlement it replaces
+        for adjacentHex in self.topology.vertexHexList[v]:
+            self.addHexProduction(adjacentHex, player, 1)
 
         #Remove settlement from player's buildGraph
-        player.buildGraph['SETTLEMENTS'].remove(v_coord)
+        player.buildGraph['SETTLEMENTS'].remove(v)
+
+    #Function to apply a hypothetical action to the board and the player's buildGraph, so it can be undone later
+    #action is a tuple (type, index, player): 'ROAD' on an edge, 'SETTLEMENT' or 'CITY' on a vertex, or 'ROBBER' on a hex (player None)
+    #Only pieces are placed - no resources are paid and no points are given
+    def apply(self, action):
+        actionType, index, player = action
+        if(actionType == 'ROAD'):
+            self.journal.append((action,))
+            player.buildGraph['ROADS'].append(index)
+            self.updateBoardGraph_road(index, player)
+
+        elif(actionType == 'SETTLEMENT'):
+            self.journal.append((action, self.occupiedMask, self.blockedMask))
+            player.buildGraph['SETTLEMENTS'].append(index)
+            self.updateBoardGraph_settlement(index, player)
+
+        elif(actionType == 'CITY'):
+            self.journal.append((action, player.buildGraph['SETTLEMENTS'].index(index)))
+            player.buildGraph['CITIES'].append(index)
+            self.updateBoardGraph_city(index, player)
+
+        elif(actionType == 'ROBBER'):
+            self.journal.append((action, self.robberHex))
+            self.updateBoardGraph_robber(index)
+
+    #Function to undo the latest applied action, restoring only what it changed
+    def undo(self):
+        undoEntry = self.journal.pop()
+        actionType, index, player = undoEntry[0]
+        if(actionType == 'ROAD'):
+            player.buildGraph['ROADS'].pop()
+            self.remove_road_from_boardGraph(index)
+
+        elif(actionType == 'SETTLEMENT'):
+            player.buildGraph['SETTLEMENTS'].pop()
+            self.vertexOwner[index] = None
+            self.vertexBuilding[index] = 0
+            self.zobristHash ^= buildingKeys[player.seat][1][index]
+            del self.potentialCities[player][index]
+            self.settlementMask[player] &= ~(1 << index)
+            self.occupiedMask, self.blockedMask = undoEntry[1], undoEntry[2]
+
+            #Other players can build roads through this vertex again
+            for p, roadVertexCount in self.roadVertexCount.items():
+                if(p != player and roadVertexCount[index] > 0):
+                    for vertexEdge in self.topology.vertexEdgeList[index]:
+                        self.updatePotentialRoad(vertexEdge, p)
+
+            for adjacentHex in self.topology.vertexHexList[index]:
+                self.addHexProduction(adjacentHex, player, -1)
+
+        elif(actionType == 'CITY'):
+            player.buildGraph['CITIES'].pop()
+            player.buildGraph['SETTLEMENTS'].insert(undoEntry[1], index)
+            self.vertexBuilding[index] = 1
+            self.zobristHash ^= buildingKeys[player.seat][1][index] ^ buildingKeys[player.seat][2][index]
+            self.potentialCities[player] = {settlement: True for settlement in player.buildGraph['SETTLEMENTS']}
+            self.settlementMask[player] |= 1 << index
+            self.cityMask[player] &= ~(1 << index)
+
+            for adjacentHex in self.topology.vertexHexList[index]:
+                self.addHexProduction(adjacentHex, player, -1)
+
+        elif(actionType == 'ROBBER'):
+            self.updateBoardGraph_robber(undoEntry[1])
+
+    #Function to start tracking the legal moves of a player
+    def addPlayerFrontier(self, player):
+        if(player not in self.roadVertexCount):
+            self.settlementMask[player] = 0
+            self.cityMask[player] = 0
+            self.roadMask[player] = 0
+            self.roadVertexMask[player] = 0
+            self.roadVertexCount[player] = [0] * self.topology.numVertices
+            self.potentialRoadMask[player] = 0
+            self.potentialCities[player] = {}
+
+    #Function to recheck if a player can build a road on an edge
+    #The edge has to be free and start from a vertex with one of the player's roads, not colonised by another player
+    def updatePotentialRoad(self, edge, player):
+        canBuild = False
+        if(self.edgeOwner[edge] == None):
+            for vertex in self.topology.edgeVertexList[edge]:
+                if(self.roadVertexCount[player][vertex] > 0 and self.vertexOwner[vertex] in [None, player]):
+                    canBuild = True
+
+        if(canBuild):
+            self.potentialRoadMask[player] |= 1 << edge
+        else:
+            self.potentialRoadMask[player] &= ~(1 << edge)
+
+    #Function to get the edges a player could build a road on after building the given roads (a list of edges) - only
+    #edges it can't build on now, in ascending order. Works on the masks alone, without building the roads
+    def getNewPotentialRoads(self, player, roads):
+        self.addPlayerFrontier(player)
+        newRoadMask = indexMask(roads) & ~self.roadMask[player]
+
+        #Free edges at the ends of the new roads, unless another player colonised that end
+        reachMask = 0
+        for edge in maskIndices(newRoadMask):
+            for vertex in self.topology.edgeVertexList[edge]:
+                if(self.vertexOwner[vertex] in [None, player]):
+                    reachMask |= self.topology.vertexEdgeMasks[vertex]
+
+        builtMask = newRoadMask
+        for roadMask in self.roadMask.values():
+            builtMask |= roadMask
+        return maskIndices(reachMask & ~builtMask & ~self.potentialRoadMask[player])
+
+    #Function to get the vertices colonised by other players, which cut the player's roads
+    def getCutMask(self, player):
+        return self.occupiedMask & ~(self.settlementMask.get(player, 0) | self.cityMask.get(player, 0))
+
+    #Function to get the length of a player's longest road - the longest trail through the player's roads
+    #A trail uses each road once and can't pass through a vertex colonised by another player, only start or end there
+    #roadMask defaults to the player's roads, any other edge mask gives the length for that hypothetical set of roads
+    def getRoadLength(self, player, roadMask=None):
+        if(roadMask is None):
+            return max((length for networkMask, length in self.getRoadNetworkLengths(player)), default=0)
+
+        cutMask = self.getCutMask(player)
+        maxLength = 0
+        for networkMask in self.getRoadNetworks(roadMask, cutMask):
+            maxLength = max(maxLength, self.getNetworkLength(networkMask, cutMask))
+        return maxLength
+
+    #Function to get a player's longest road if the given roads (a list of edges) were built too, without building them
+    #Only the networks the new roads join are searched, the others keep their cached lengths
+    def getRoadLengthWithRoads(self, player, roads):
+        return self.getRoadLengthsWithRoads(player, [roads])[0]
+
+    #Function to get a player's longest road for each of a list of road sets, as if only that set of roads were built too
+    #All the sets start from the player's cached networks. A single new road that doesn't close a loop extends
+    #the longest trails from its two ends, and the trail from each end vertex is searched once for the whole list,
+    #so the candidate roads of a turn share one search per vertex they are built at
+    #Other sets search the networks they join, and a network that comes up in more than one set is only searched once
+    def getRoadLengthsWithRoads(self, player, roadSets):
+        networkLengths = self.getRoadNetworkLengths(player)
+        roadMask = self.roadMask.get(player, 0)
+        cutMask = self.getCutMask(player)
+        baseLength = max((length for networkMask, length in networkLengths), default=0)
+
+        #Network of each vertex a new road can join one through - vertices colonised by other players join nothing
+        vertexNetworks = {}
+        for networkMask, length in networkLengths:
+            for edge in maskIndices(networkMask):
+                for vertex in self.topology.edgeVertexList[edge]:
+                    if(not (cutMask >> vertex) & 1):
+                        vertexNetworks[vertex] = networkMask
+
+        trailLengths = {} #Dict of vertex - longest trail starting there in its network, for the vertices searched by this call
+        knownLengths = {} #Dict of networkMask - longest trail, for the networks searched by this call
+        roadLengths = []
+        for roads in roadSets:
+            newRoadMask = indexMask(roads) & ~roadMask
+            if(not newRoadMask):
+                roadLengths.append(baseLength)
+                continue
+
+            if(newRoadMask & (newRoadMask - 1) == 0):  #A single new road
+                v1, v2 = self.topology.edgeVertexList[newRoadMask.bit_length() - 1]
+                network1, network2 = vertexNetworks.get(v1), vertexNetworks.get(v2)
+                if(network1 is None or network1 != network2):
+                    #The road joins different networks (or none) at its ends, so a trail through it is a trail
+                    #ending at v1 in one, the road, and a trail starting at v2 in the other
+                    for vertex, networkMask in ((v1, network1), (v2, network2)):
+                        if(networkMask is not None and vertex not in trailLengths):
+                            trailLengths[vertex] = self.getTrailLength(vertex, 0, networkMask, cutMask)
+
+                    roadLengths.append(max(baseLength, trailLengths.get(v1, 0) + 1 + trailLengths.get(v2, 0)))
+                    continue
+
+            joinedMask = 0
+            maxLength = 0
+            for networkMask in self.getRoadNetworks(roadMask | newRoadMask, cutMask, newRoadMask):
+                if(networkMask not in knownLengths):
+                    knownLengths[networkMask] = self.getNetworkLength(networkMask, cutMask)
+                joinedMask |= networkMask
+                maxLength = max(maxLength, knownLengths[networkMask])
+
+            #Networks the new roads don't join keep their length
+            for networkMask, length in networkLengths:
+                if(not (networkMask & joinedMask)):
+                    maxLength = max(maxLength, length)
+            roadLengths.append(maxLength)
+
+        return roadLengths
+
+    #Function to get the networks of a player's roads with the longest trail of each, as a list of (networkMask, length)
+    #The result is cached for the player's roads and the cut vertices on them:
+    #after new roads only the networks they join are searched again, and a cut (or removing a road) rebuilds the list
+    def getRoadNetworkLengths(self, player):
+        roadMask = self.roadMask.get(player, 0)
+        cutMask = self.getCutMask(player)
+
+        networkLengths = None
+        if(player in self.roadNetworkCache):
+            cachedRoadMask, cachedVertexMask, cachedCutMask, cachedLengths = self.roadNetworkCache[player]
+            if(((cachedCutMask ^ cutMask) & cachedVertexMask) == 0 and (cachedRoadMask & ~roadMask) == 0):
+                if(cachedRoadMask == roadMask):
+                    return cachedLengths
+                networkLengths = self.addRoadsToNetworks(cachedLengths, roadMask, roadMask & ~cachedRoadMask, cutMask)
+
+        if(networkLengths is None):
+            networkLengths = [(networkMask, self.getNetworkLength(networkMask, cutMask))
+                              for networkMask in self.getRoadNetworks(roadMask, cutMask)]
+
+        self.roadNetworkCache[player] = (roadMask, self.roadVertexMask.get(player, 0), cutMask, networkLengths)
+        return networkLengths
+
+    #Function to add the roads of newRoadMask to a list of (networkMask, length) - roadMask has the old and new roads
+    #Networks joined by a new road are merged and searched again, the rest are kept as they are
+    def addRoadsToNetworks(self, networkLengths, roadMask, newRoadMask, cutMask):
+        newNetworks = self.getRoadNetworks(roadMask, cutMask, newRoadMask)
+        joinedMask = 0
+        for networkMask in newNetworks:
+            joinedMask |= networkMask
+
+        return [(networkMask, length) for networkMask, length in networkLengths if not (networkMask & joinedMask)] + \
+               [(networkMask, self.getNetworkLength(networkMask, cutMask)) for networkMask in newNetworks]
+
+    #Function to split an edge mask of roads into networks - roads connected through vertices that aren't cut
+    #A trail never leaves its network, so each network is searched on its own
+    #startMask limits the result to the networks with one of its roads
+    def getRoadNetworks(self, roadMask, cutMask, startMask=None):
+        if(startMask is None):
+            startMask = roadMask
+
+        networks = []
+        while(startMask):
+            networkMask = startMask & -startMask
+            frontierMask = networkMask
+            while(frontierMask):
+                edgeBit = frontierMask & -frontierMask
+                frontierMask ^= edgeBit
+                for vertex in self.topology.edgeVertexList[edgeBit.bit_length() - 1]:
+                    if(not (cutMask >> vertex) & 1):
+                        newEdges = self.topology.vertexEdgeMasks[vertex] & roadMask & ~networkMask
+                        networkMask |= newEdges
+                        frontierMask |= newEdges
+
+            networks.append(networkMask)
+            startMask &= ~networkMask
+
+        return networks
+
+    #Function to get the longest trail in a road network
+    #A longest trail can always be made to start at a dead end, a fork or a cut vertex - the search only starts there
+    #A network without any of those is a loop, and the whole loop is the longest trail
+    def getNetworkLength(self, networkMask, cutMask):
+        numRoads = networkMask.bit_count()
+        startVertices = set()
+        for edge in maskIndices(networkMask):
+            for vertex in self.topology.edgeVertexList[edge]:
+                if((cutMask >> vertex) & 1 or (self.topology.vertexEdgeMasks[vertex] & networkMask).bit_count() != 2):
+                    startVertices.add(vertex)
+
+        maxLength = 0 if startVertices else numRoads
+        for vertex in startVertices:
+            maxLength = max(maxLength, self.getTrailLength(vertex, 0, networkMask, cutMask))
+            if(maxLength == numRoads):  #Every road is on the trail
+                break
+        return maxLength
+
+    #Function to get the longest trail from vertex through the roads of networkMask that aren't in usedMask yet
+    #Depth first search with the used roads as a bitmask, so nothing is copied or undone between branches
+    def getTrailLength(self, vertex, usedMask, networkMask, cutMask):
+        maxLength = 0
+        edgeMask = self.topology.vertexEdgeMasks[vertex] & networkMask & ~usedMask
+        while(edgeMask):
+            edgeBit = edgeMask & -edgeMask
+            edgeMask ^= edgeBit
+            v1, v2 = self.topology.edgeVertexList[edgeBit.bit_length() - 1]
+            nextVertex = v1 ^ v2 ^ vertex  #Other end of the road
+
+            if((cutMask >> nextVertex) & 1):  #The trail ends at a vertex colonised by another player
+                trailLength = 1
+            else:
+                trailLength = 1 + self.getTrailLength(nextVertex, usedMask | edgeBit, networkMask, cutMask)
+            maxLength = max(maxLength, trailLength)
+
+        return maxLength
 
     #Function to update boardGraph with Robber on hexTile
     def updateBoardGraph_robber(self, hexIndex):
-        #Set all flags to false
-        for hex_tile in self.hexTileDict.values():
-            hex_tile.robber = False
-
+        #Take the robber off its current hex, giving back that hex's production
+        oldHex = self.robberHex
+        self.hexTileDict[oldHex].robber = False
+        self.robberSpots[oldHex] = self.hexTileDict[oldHex]
+        for player, amount in self.hexProduction[oldHex].items():
+            self.addRollProduction(oldHex, player, amount)
+
+        self.robberHex = hexIndex
         self.hexTileDict[hexIndex].robber = True
+        self.zobristHash ^= robberKeys[oldHex] ^ robberKeys[hexIndex]
+        del self.robberSpots[hexIndex]
+        for player, amount in self.hexProduction[hexIndex].items():
+            self.addRollProduction(hexIndex, player, -amount)
+
+    #Function to add production for a player on a hex to the production index
+    #Entries that drop to 0 are removed, so undoing a build leaves the index as if it was never built
+    def addHexProduction(self, hexIndex, player, amount):
+        self.hexProduction[hexIndex][player] = self.hexProduction[hexIndex].get(player, 0) + amount
+        if(self.hexProduction[hexIndex][player] == 0):
+            del self.hexProduction[hexIndex][player]
+        if(hexIndex != self.robberHex):
+            self.addRollProduction(hexIndex, player, amount)
+
+    #Function to add to what a player collects when the number on a hex is rolled
+    def addRollProduction(self, hexIndex, player, amount):
+        hexResource = self.hexTileDict[hexIndex].resource
+        if(hexResource.num == None): #Desert
+            return
+
+        playerProduction = self.rollProduction[hexResource.num].setdefault(player, {})
+        playerProduction[hexResource.type] = playerProduction.get(hexResource.type, 0) + amount
+        if(playerProduction[hexResource.type] == 0):
+            del playerProduction[hexResource.type]
+            if(not playerProduction):
+                del self.rollProduction[hexResource.num][player]
 
     #Function to get possible robber hexTiles
-    #Return robber hex spots with their hexIndex - rect representations as key-value pairs
+    #Return robber hex spots as a dict of hexIndex - hexTile, owned by the board so do not modify it
     def get_robber_spots(self):
-        robberHexDict = {}
-        for indx, hex_tile in self.hexTileDict.items():
-            if(hex_tile.robber == False):
-                #robberHexDict[indx] = self.draw_possible_robber(hex_tile.pixelCenter)
-                robberHexDict[indx] = hex_tile
-
-        return robberHexDict
+        return self.robberSpots
 
     #Get a Dict of players to rob based on the hexIndex of the robber, with the circle Rect as the value
     def get_players_to_rob(self, hexIndex):
         #Extract all 6 vertices of this hexTile
-        hexTile = self.hexTileDict[hexIndex]
-        vertexList = polygon_corners(self.flat, hexTile.hex)
+        vertexList = self.topology.hexVertexList[hexIndex]
 
         playersToRobDict = {}
 
         for vertex in vertexList:
-            if(self.boardGraph[vertex].state['Player'] != None): #There is a settlement on this vertex
-                playerToRob = self.boardGraph[vertex].state['Player']
+            if(self.vertexOwner[vertex] != None): #There is a settlement on this vertex
+                playerToRob = self.vertexOwner[vertex]
                 if(playerToRob not in playersToRobDict.keys()): #only add a player once with his/her first settlement/city
                     #playersToRobDict[playerToRob] = self.draw_possible_players_to_rob(vertex)
                     playersToRobDict[playerToRob] = vertex
 
         return playersToRobDict
-
-
-    #Function to get a hexTile with a particular number
-    def getHexResourceRolled(self, diceRollNum):
-        hexesRolled = [] #Empty list to store the hex index rolled (min 1, max 2)
-        for hexTile in self.hexTileDict.values():
-            if hexTile.resource.num == diceRollNum:
-                hexesRolled.append(hexTile.index)
-
-        return hexesRolled
\ No newline at end of file
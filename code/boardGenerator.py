@@ -0,0 +1,119 @@
+#Settlers of Catan
+#Random board layout generation - no pygame needed
+
+import itertools
+import numpy as np
+from boardTopology import *
+
+#Resource tiles and number tokens of the standard board
+#Layouts are stored compactly as codes: resourceTypes[code] for each hex, the dice number for each hex (0 for the desert)
+resourceTypes = ('DESERT', 'ORE', 'BRICK', 'WHEAT', 'WOOD', 'SHEEP')
+resourceTileCounts = {'DESERT':1, 'ORE':3, 'BRICK':3, 'WHEAT':4, 'WOOD':4, 'SHEEP':4}
+redNumbers = (6, 6, 8, 8)
+otherNumbers = (2, 3, 3, 4, 4, 5, 5, 9, 9, 10, 10, 11, 11, 12)
+
+#Port types in the order they are dealt to the shuffled port vertex pairs - portTypes[code] for each pair
+portTypes = ('2:1 BRICK', '2:1 SHEEP', '2:1 WOOD', '2:1 WHEAT', '2:1 ORE', '3:1 PORT')
+portDeal = (0, 1, 2, 3, 4, 5, 5, 5, 5)
+
+#Non-desert resource tiles as codes
+resourceTileCodes = tuple(code for code, r in enumerate(resourceTypes) if r != 'DESERT' for i in range(resourceTileCounts[r]))
+
+
+#Function to get every set of hexes the 6's and 8's can be placed on without two of them being adjacent
+#Returns an array with one row of 4 hex indices per legal set
+def get_red_number_position_sets(topology):
+    validSets = []
+    for positions in itertools.combinations(range(topology.numHexes), len(redNumbers)):
+        if all(p2 not in topology.hexNeighborList[p1] for p1, p2 in itertools.combinations(positions, 2)):
+            validSets.append(positions)
+
+    validSets = np.array(validSets, dtype=np.int8)
+    validSets.setflags(write=False)
+    return validSets
+
+#Precomputed legal red number positions on the standard board
+redNumberPositionSets = get_red_number_position_sets(standardTopology)
+
+
+#Function to generate a random legal layout of resources and numbers
+#Every legal board is equally likely, the same as shuffling all tiles until no 6's and 8's are adjacent:
+#the red numbers go on a uniformly chosen legal position set, the desert on one of the 15 other hexes,
+#and the remaining numbers and resources are shuffled over what is left
+#rng can be np.random or a numpy Generator. Returns (resource codes, numbers) arrays of length 19
+def generate_layout(rng=np.random):
+    numHexes = standardTopology.numHexes
+    redPositions = redNumberPositionSets[rng.choice(len(redNumberPositionSets))]
+
+    openPositions = np.setdiff1d(np.arange(numHexes), redPositions)
+    desertPosition = openPositions[rng.choice(len(openPositions))]
+    otherPositions = openPositions[openPositions != desertPosition]
+
+    numbers = np.zeros(numHexes, dtype=np.int8)
+    numbers[redPositions] = rng.permutation(redNumbers)
+    numbers[otherPositions] = rng.permutation(otherNumbers)
+
+    resources = np.zeros(numHexes, dtype=np.int8)
+    resources[np.arange(numHexes) != desertPosition] = rng.permutation(resourceTileCodes)
+
+    return resources, numbers
+
+#Function to generate random port types for the port vertex pairs
+#Returns an array with the port type code of each pair in topology.portVertexPairs
+def generate_ports(rng=np.random):
+    ports = np.zeros(len(portDeal), dtype=np.int8)
+    ports[rng.permutation(len(portDeal))] = portDeal
+    return ports
+
+#Function to generate n random boards for batch experiments, all at once with numpy
+#Same distribution as generate_layout/generate_ports - the red number position sets are drawn for every board together
+#Returns (resources, numbers, ports) as int8 arrays of shape (n, 19), (n, 19) and (n, 9)
+def generate_boards(n, seed=None, rng=None):
+    if rng is None:
+        rng = np.random.default_rng(seed)
+
+    numHexes = standardTopology.numHexes
+    rows = np.arange(n)[:, None]
+
+    #Legal positions for the 6's and 8's
+    redPositions = redNumberPositionSets[rng.integers(len(redNumberPositionSets), size=n)]
+    isRed = np.zeros((n, numHexes), dtype=bool)
+    isRed[rows, redPositions] = True
+
+    #Desert on a uniformly chosen hex that is not red - the k-th open hex of each board
+    openCount = np.cumsum(~isRed, axis=1)
+    desertRank = rng.integers(numHexes - len(redNumbers), size=n)[:, None]
+    desertPosition = np.argmax((openCount == desertRank + 1) & ~isRed, axis=1)
+    isDesert = np.zeros((n, numHexes), dtype=bool)
+    isDesert[np.arange(n), desertPosition] = True
+
+    #Shuffle the numbers over the red and the remaining hexes of each board
+    numbers = np.zeros((n, numHexes), dtype=np.int8)
+    numbers[rows, redPositions] = rng.permuted(np.tile(np.array(redNumbers, dtype=np.int8), (n, 1)), axis=1)
+    otherPositions = np.nonzero(~(isRed | isDesert))[1].reshape(n, len(otherNumbers))
+    numbers[rows, otherPositions] = rng.permuted(np.tile(np.array(otherNumbers, dtype=np.int8), (n, 1)), axis=1)
+
+    #Shuffle the resources over every hex but the desert
+    resources = np.zeros((n, numHexes), dtype=np.int8)
+    resourcePositions = np.nonzero(~isDesert)[1].reshape(n, len(resourceTileCodes))
+    resources[rows, resourcePositions] = rng.permuted(np.tile(np.array(resourceTileCodes, dtype=np.int8), (n, 1)), axis=1)
+
+    #Deal the port types to a shuffled order of port pairs
+    ports = np.zeros((n, len(portDeal)), dtype=np.int8)
+    ports[rows, rng.permuted(np.tile(np.arange(len(portDeal)), (n, 1)), axis=1)] = portDeal
+
+    return resources, numbers, ports
+
+#Function to stream n random boards in chunks of at most chunkSize boards
+#Yields (resources, numbers, ports) arrays like generate_boards. The boards only depend on seed and chunkSize
+def iterate_boards(n, seed=None, chunkSize=65536):
+    rng = np.random.default_rng(seed)
+    for start in range(0, n, chunkSize):
+        yield generate_boards(min(chunkSize, n - start), rng=rng)
+
+#Function to check the 6/8 rule for many boards at once
+#Takes an (n, 19) array of numbers, returns a boolean array that is True for boards with no adjacent 6's and 8's
+def check_red_numbers(numbers):
+    hexPairs = np.array([(h1, h2) for h1 in range(standardTopology.numHexes) for h2 in standardTopology.hexNeighborList[h1] if h1 < h2])
+    isRed = (numbers == 6) | (numbers == 8)
+    return ~np.any(isRed[:, hexPairs[:, 0]] & isRed[:, hexPairs[:, 1]], axis=1)
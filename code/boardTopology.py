@@ -0,0 +1,158 @@
+#Settlers of Catan
+#Board topology implementation - integer ids for hexes, vertices and edges
+
+import numpy as np
+import types
+from hexLib import *
+
+#Class to store the fixed shape of the board as integer indexed arrays
+#Vertices are numbered 0-53 and edges 0-71, in the same order the hexes and their corners are visited
+#The graph is built from the axial coordinates alone, in time linear in the number of hexes
+#Every adjacency is kept as a numpy array padded with -1, and as a tuple of tuples for fast python loops
+#Pixel coordinates are only kept as a lookup for rendering
+#The topology never changes once built - boards share one instance (standardTopology) and only keep their own state
+class boardTopology():
+    'Class Definition for Catan Board Topology'
+    def __init__(self, layout, hexCoordList, portPairList=()):
+        self.layout = layout
+        self.hexCoordList = tuple(hexCoordList) #Axial coordinates of each hex, by hexIndex
+        self.numHexes = len(hexCoordList)
+        self.portVertexPairs = tuple(tuple(pair) for pair in portPairList) #Vertex index pairs of each port
+
+        vertexPixelList = [] #Pixel coordinates of each vertex, by vertex index
+        cornerKeyToVertex = {} #Dict to look up vertex index from the hexes that meet at that corner
+        vertexHexList = [] #List of adjacent hexes for each vertex
+        hexVertexList = [] #List of the 6 corner vertices for each hex
+        vertexNeighborSets = [] #Set of neighboring vertices for each vertex
+
+        #Visit the corners of every hex and add each new corner as a vertex
+        for hexIndex, axialCoord in enumerate(hexCoordList):
+            h = Axial_Hex(axialCoord)
+            hexCorners = polygon_corners(layout, h)
+            cornerIndices = []
+            for corner in range(6):
+                cornerKey = hex_corner_key(h, corner)
+                if cornerKey not in cornerKeyToVertex:
+                    cornerKeyToVertex[cornerKey] = len(vertexPixelList)
+                    vertexPixelList.append(hexCorners[corner])
+                    vertexHexList.append([])
+                    vertexNeighborSets.append(set())
+
+                vIndex = cornerKeyToVertex[cornerKey]
+                vertexHexList[vIndex].append(hexIndex)
+                cornerIndices.append(vIndex)
+
+            #Each side of the hex joins two consecutive corners
+            for corner in range(6):
+                v1 = cornerIndices[corner]
+                v2 = cornerIndices[(corner + 1) % 6]
+                vertexNeighborSets[v1].add(v2)
+                vertexNeighborSets[v2].add(v1)
+
+            hexVertexList.append(cornerIndices)
+
+        self.numVertices = len(vertexPixelList)
+        vertexNeighborList = [sorted(neighbors) for neighbors in vertexNeighborSets]
+
+        #Number each undirected edge once, from its lower vertex index
+        edgeVertexList = []
+        self.edgeIndex = {} #Dict to get the edge index from a vertex pair, in either orientation
+        for v1 in range(self.numVertices):
+            for v2 in vertexNeighborList[v1]:
+                if(v1 < v2):
+                    self.edgeIndex[(v1, v2)] = len(edgeVertexList)
+                    self.edgeIndex[(v2, v1)] = len(edgeVertexList)
+                    edgeVertexList.append((v1, v2))
+
+        #Edges of each vertex follow the order of its neighbors
+        vertexEdgeList = [[self.edgeIndex[(v1, v2)] for v2 in vertexNeighborList[v1]] for v1 in range(self.numVertices)]
+
+        self.numEdges = len(edgeVertexList)
+        self.edgeIndex = types.MappingProxyType(self.edgeIndex)
+
+        #Neighboring hexes on the board, from the 6 axial directions
+        hexCoordToIndex = {(coord.q, coord.r): hexIndex for hexIndex, coord in enumerate(self.hexCoordList)}
+        hexNeighborList = []
+        for axialCoord in self.hexCoordList:
+            h = Axial_Hex(axialCoord)
+            neighbors = [hex_neighbor(h, direction) for direction in range(6)]
+            hexNeighborList.append(sorted(hexCoordToIndex[(n.q, n.r)] for n in neighbors if (n.q, n.r) in hexCoordToIndex))
+
+        #Numpy arrays for vectorized use
+        self.vertexNeighbors = paddedArray(vertexNeighborList, 3)
+        self.vertexHexes = paddedArray(vertexHexList, 3)
+        self.vertexEdges = paddedArray(vertexEdgeList, 3)
+        self.edgeVertices = paddedArray(edgeVertexList, 2)
+        self.hexVertices = paddedArray(hexVertexList, 6)
+        self.hexNeighbors = paddedArray(hexNeighborList, 6)
+
+        #Tuple views of the same arrays for loops over a single vertex/edge/hex
+        self.vertexNeighborList = tupleView(self.vertexNeighbors)
+        self.vertexHexList = tupleView(self.vertexHexes)
+        self.vertexEdgeList = tupleView(self.vertexEdges)
+        self.edgeVertexList = tupleView(self.edgeVertices)
+        self.hexVertexList = tupleView(self.hexVertices)
+        self.hexNeighborList = tupleView(self.hexNeighbors)
+
+        #Bitboard masks - bit v set for vertex v, bit e set for edge e
+        self.allVerticesMask = (1 << self.numVertices) - 1
+        self.vertexNeighborMasks = tuple(indexMask(neighbors) for neighbors in self.vertexNeighborList) #Neighboring vertices of each vertex
+        self.vertexClosedMasks = tuple(neighborMask | (1 << v) for v, neighborMask in enumerate(self.vertexNeighborMasks)) #Each vertex and its neighbors
+        self.vertexEdgeMasks = tuple(indexMask(edges) for edges in self.vertexEdgeList) #Edges of each vertex - the edge adjacency of the road graph
+
+        #Rendering lookup
+        self.vertexPixels = tuple(vertexPixelList)
+
+    #Function to get the index of the edge between vertices v1 and v2 (None if they are not neighbors)
+    def getEdge(self, v1, v2):
+        return self.edgeIndex.get((v1, v2))
+
+    #View the topology info
+    def printTopology(self):
+        print("Hexes:{}, Vertices:{}, Edges:{}".format(self.numHexes, self.numVertices, self.numEdges))
+        for vIndex in range(self.numVertices):
+            print("Index:{}, Pixel:{}, Neighbors:{}, AdjacentHexes:{}".format(vIndex, self.vertexPixels[vIndex], self.vertexNeighborList[vIndex], self.vertexHexList[vIndex]))
+
+
+#Function to convert a list of variable length rows into a read-only int array padded with -1
+def paddedArray(rows, width):
+    arr = np.full((len(rows), width), -1, dtype=np.int16)
+    for i, row in enumerate(rows):
+        arr[i, :len(row)] = row
+    arr.setflags(write=False)
+    return arr
+
+#Function to convert a padded array into a tuple of tuples without the padding
+def tupleView(arr):
+    return tuple(tuple(int(x) for x in row if x >= 0) for row in arr)
+
+#Function to get the bitboard mask with the bits of the given indices set
+def indexMask(indices):
+    mask = 0
+    for i in indices:
+        mask |= 1 << i
+    return mask
+
+#Function to get the indices of the set bits in a bitboard mask, in ascending order
+def maskIndices(mask):
+    indices = []
+    while(mask):
+        lowBit = mask & -mask
+        indices.append(lowBit.bit_length() - 1)
+        mask ^= lowBit
+    return indices
+
+
+#Axial coordinates (q, r) of the 19 hexes of the standard board, by hexIndex
+standardHexCoords = (Axial_Point(0,0), Axial_Point(0,-1), Axial_Point(1,-1), Axial_Point(1,0), Axial_Point(0,1), Axial_Point(-1,1), Axial_Point(-1,0),
+                     Axial_Point(0,-2), Axial_Point(1,-2), Axial_Point(2,-2), Axial_Point(2,-1), Axial_Point(2,0), Axial_Point(1,1), Axial_Point(0,2),
+                     Axial_Point(-1,2), Axial_Point(-2,2), Axial_Point(-2,1), Axial_Point(-2,0), Axial_Point(-1,-1))
+
+#List of vertex indices of all port pairs on the standard board
+standardPortPairs = ((43,44), (33,34), (45,49), (27,53), (24,29), (30,31), (36,39), (41,42), (51,52))
+
+#Layout of the standard board - hex size 80 centered in a 1000x800 window
+standardLayout = Layout(layout_flat, Point(80, 80), Point(1000/2, 800/2))
+
+#Topology shared by every board, built once per process
+standardTopology = boardTopology(standardLayout, standardHexCoords, standardPortPairs)
@@ -0,0 +1,203 @@
+# Settlers of Catan
+# Command line entry point for batch runs - run from this folder with python -m catan <command>
+#
+#   python -m catan simulate --games 1000 --seed 1 --workers 8 --output outcomes.jsonl
+#   python -m catan tournament --ai params_a.json params_b.json --games 1000
+#   python -m catan bench --games 20
+#   python -m catan replay --outcomes outcomes.jsonl --game 17 --view
+#   python -m catan replay --seed 5 --log-level DEBUG
+#   python -m catan roads --random 500
+#
+# AI parameter files are JSON objects of dylanAIPlayer.updateAI keyword arguments, like {"ore": 5, "port_desire": 0.5}
+# pygame is only imported by replay --view
+
+from simulation import *
+import argparse
+import json
+import logging
+import sys
+import time
+
+
+# Function to read a list of AI parameter files
+def load_ai_params(paths):
+    params = []
+    for path in paths:
+        with open(path) as f:
+            params.append(json.load(f))
+    return params
+
+
+# Function to get the seats of a simulation from the --seats and --ai options
+# One parameter file plays every seat, otherwise there is one file per seat
+def get_seats(args):
+    if not args.ai:
+        return args.seats
+    params = load_ai_params(args.ai)
+    if len(params) == 1:
+        return params * args.seats
+    return params
+
+
+# Function to write outcomes as JSON lines, with the seat parameters and game limits needed to replay each game
+def write_outcomes(path, outcomes, seats, max_points, max_turns):
+    with open(path, 'w') as f:
+        for outcome in outcomes:
+            record = dict(outcome, seed=seed_to_json(outcome['seed']), max_points=max_points, max_turns=max_turns)
+            record['seats'] = seats if 'contenders' not in outcome else [seats[c] for c in outcome['contenders']]
+            f.write(json.dumps(record) + '\n')
+
+
+# Function to print the win rate of each seat or contender, and the average game length
+def print_summary(outcomes, names, key=None):
+    wins = [0] * len(names)
+    for outcome in outcomes:
+        if outcome['winner'] is not None:
+            winner = outcome['winner'] if key is None else outcome[key][outcome['winner']]
+            wins[winner] += 1
+
+    numGames = max(len(outcomes), 1)
+    for name, numWins in zip(names, wins):
+        print("{}: {} wins ({:.1%})".format(name, numWins, numWins / numGames))
+    print("No winner: {}".format(sum(outcome['winner'] is None for outcome in outcomes)))
+    print("Average turns: {:.1f}".format(sum(outcome['turns'] for outcome in outcomes) / numGames))
+
+
+def run_simulate(args):
+    seats = seat_params(get_seats(args))
+    outcomes = simulate(args.games, seats=seats, seeds=args.seed, workers=args.workers,
+                        max_turns=args.max_turns, max_points=args.max_points)
+    print_summary(outcomes, ['Seat {}'.format(seat + 1) for seat in range(len(seats))])
+    if args.output:
+        write_outcomes(args.output, outcomes, seats, args.max_points, args.max_turns)
+
+
+def run_tournament(args):
+    contenders = load_ai_params(args.ai)
+    outcomes = tournament(args.games, contenders, n_seats=args.seats, seeds=args.seed, workers=args.workers,
+                          max_turns=args.max_turns, max_points=args.max_points)
+    print_summary(outcomes, args.ai, key='contenders')
+    if args.output:
+        write_outcomes(args.output, outcomes, contenders, args.max_points, args.max_turns)
+
+
+def run_bench(args):
+    seats = seat_params(get_seats(args))
+    startTime = time.perf_counter()
+    outcomes = simulate(args.games, seats=seats, seeds=args.seed, workers=args.workers,
+                        max_turns=args.max_turns, max_points=args.max_points)
+    runTime = time.perf_counter() - startTime
+
+    numTurns = sum(outcome['turns'] for outcome in outcomes)
+    print("{} games, {} turns in {:.2f} s".format(len(outcomes), numTurns, runTime))
+    print("{:.1f} ms per game, {:.2f} ms per turn, {:.1f} games/s".format(
+        1000 * runTime / len(outcomes), 1000 * runTime / max(numTurns, 1), len(outcomes) / runTime))
+
+
+# Replays one game with every move printed, from --seed or from a line of a simulate/tournament output file
+# A game from an output file is replayed with the victory points and turn limit it was played with
+def run_replay(args):
+    maxPoints, maxTurns = args.max_points, args.max_turns
+    if args.outcomes:
+        with open(args.outcomes) as f:
+            for line in f:
+                record = json.loads(line)
+                if record['game'] == args.game:
+                    break
+            else:
+                sys.exit("Game {} is not in {}".format(args.game, args.outcomes))
+        seed = seed_from_json(record['seed'])
+        seats = record['seats']
+        maxPoints = record.get('max_points', maxPoints)  # Files written before the limits were recorded
+        maxTurns = record.get('max_turns', maxTurns)
+    elif args.seed is not None:
+        seed = args.seed
+        seats = seat_params(get_seats(args))
+    else:
+        sys.exit("replay needs --seed or --outcomes")
+
+    if args.view:
+        from catanGame import catanGame
+        game = catanGame(seed=seed, pace=args.pace, numPlayers=len(seats), player_position=-1,
+                         maxPoints=maxPoints, aiParams=seats)
+        game.playCatan(maxTurns=maxTurns)
+        game.wait_for_quit()
+    else:
+        game = catanGameEngine(numPlayers=len(seats), seed=seed, maxPoints=maxPoints, aiParams=seats)
+        game.playCatan(maxTurns=maxTurns)
+
+
+# Checks the longest road implementations against each other on the road corpus, then times them
+def run_roads(args):
+    import roadBenchmark
+
+    cases = roadBenchmark.adversarial_cases() + roadBenchmark.random_cases(args.random, seed=args.seed)
+    legacyShort = roadBenchmark.check_corpus(cases)
+    print("{} road networks checked - all implementations agree with the brute force search".format(len(cases)))
+    print("Legacy recursion comes up short on {} of them: {}".format(
+        len(legacyShort), ", ".join(legacyShort[:5]) + (", ..." if len(legacyShort) > 5 else "")))
+
+    times = roadBenchmark.benchmark(cases, repeat=args.repeat)
+    for name, microseconds in times.items():
+        print("{:<42} {:>10.1f} us per network".format(name, microseconds))
+
+
+# Function to build the argument parser with one sub command for each run_ function
+def get_parser():
+    parser = argparse.ArgumentParser(prog='python -m catan', description='Batch runs of AI-only Settlers of Catan games')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    simulateParser = commands.add_parser('simulate', help='play AI-only games and report win rates by seat')
+    tournamentParser = commands.add_parser('tournament', help='play AI parameter files against each other, rotating seats')
+    benchParser = commands.add_parser('bench', help='time AI-only games')
+    replayParser = commands.add_parser('replay', help='replay one game with every move printed')
+    roadsParser = commands.add_parser('roads', help='check and time the longest road implementations on a road corpus')
+
+    for commandParser in (simulateParser, tournamentParser, benchParser, replayParser):
+        commandParser.add_argument('--seed', type=int, default=None, help='root seed, spawned into one seed per game (game seed for replay)')
+        commandParser.add_argument('--seats', type=int, default=4, help='number of AI players (default 4)')
+        commandParser.add_argument('--max-turns', type=int, default=default_max_turns, help='stop a game without a winner after this many player turns')
+        commandParser.add_argument('--max-points', type=int, default=10, help='victory points needed to win')
+        commandParser.add_argument('--log-level', default='WARNING', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+                                   help='game log level - INFO shows every move, DEBUG also the AI reasoning')
+
+    for commandParser in (simulateParser, tournamentParser, benchParser):
+        commandParser.add_argument('--games', type=int, default=100, help='number of games')
+        commandParser.add_argument('--workers', type=int, default=None, help='worker processes (default: one per core)')
+
+    for commandParser in (simulateParser, tournamentParser):
+        commandParser.add_argument('--output', default=None, help='write each game outcome to this JSON lines file')
+
+    for commandParser in (simulateParser, benchParser, replayParser):
+        commandParser.add_argument('--ai', nargs='+', default=[], help='AI parameter files, one for every seat or one per seat')
+    tournamentParser.add_argument('--ai', nargs='+', required=True, help='AI parameter files of the contenders')
+
+    benchParser.set_defaults(games=20, workers=1, seed=0)
+
+    replayParser.set_defaults(log_level='INFO')
+    replayParser.add_argument('--outcomes', default=None, help='simulate/tournament output file to take the game from')
+    replayParser.add_argument('--game', type=int, default=0, help='game number in the outcomes file')
+    replayParser.add_argument('--view', action='store_true', help='show the game in a pygame window')
+    replayParser.add_argument('--pace', action='store_true', help='pause between AI moves in the window')
+
+    roadsParser.add_argument('--random', type=int, default=200, help='random road networks to add to the hand made ones')
+    roadsParser.add_argument('--seed', type=int, default=0, help='seed of the random road networks')
+    roadsParser.add_argument('--repeat', type=int, default=5, help='timing runs, the best one is reported')
+    roadsParser.set_defaults(log_level='WARNING')
+
+    simulateParser.set_defaults(run=run_simulate)
+    tournamentParser.set_defaults(run=run_tournament)
+    benchParser.set_defaults(run=run_bench)
+    replayParser.set_defaults(run=run_replay)
+    roadsParser.set_defaults(run=run_roads)
+    return parser
+
+
+def main(argv=None):
+    args = get_parser().parse_args(argv)
+    logging.basicConfig(level=args.log_level, format='%(message)s', stream=sys.stdout)
+    args.run(args)
+
+
+if __name__ == '__main__':
+    main()
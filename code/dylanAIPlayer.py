@@ -6,6 +6,9 @@ from player import *
 import numpy as np
 import copy
 import time
+import logging
+
+logger = logging.getLogger('catan.dylanAIPlayer')
 
 # Class definition for an AI player
 
@@ -77,7 +80,7 @@ class dylanAIPlayer(player):
 
         self.game = game
 
-        print("Added new AI Player: ", self.name)
+        logger.info("Added new AI Player: %s", self.name)
 
 
     # Function to build an initial settlement 
@@ -119,7 +122,7 @@ class dylanAIPlayer(player):
 
         add resource synergy to the eval
         '''
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         total_rating = 0
 
@@ -142,7 +145,7 @@ class dylanAIPlayer(player):
                     self.get_diversity_of_settlement(board, settlement_location)
 
 
-        port = board.boardGraph[settlement_location].port
+        port = board.vertexPort[settlement_location]
         # if there is a port
         if port:
             # multiply the addition by self.port_desire
@@ -154,7 +157,7 @@ class dylanAIPlayer(player):
             board, settlement_location)
 
         if debug:
-            print("Rating of settlement: {}".format(total_rating))
+            logger.debug("Rating of settlement: %s", total_rating)
 
         return total_rating
 
@@ -166,7 +169,7 @@ class dylanAIPlayer(player):
         if the settlement exists in our setup already
         '''
         # debug var
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         total_value = 0
 
@@ -190,7 +193,7 @@ class dylanAIPlayer(player):
                         board, resource_type, hypothetical_settlement)
 
         if debug:
-            print("Eval for {} is {}".format(port, str(total_value)))
+            logger.debug("Eval for %s is %s", port, total_value)
 
         return total_value
 
@@ -222,7 +225,7 @@ class dylanAIPlayer(player):
         '''
         total_prod = 0
         # for each adjacent hex to the settlement
-        for adjacentHex in board.boardGraph[settlement].adjacentHexList:
+        for adjacentHex in board.topology.vertexHexList[settlement]:
             # get the resource type
             resourceType = board.hexTileDict[adjacentHex].resource.type
             # if the resource is the type we want to know about it
@@ -242,7 +245,7 @@ class dylanAIPlayer(player):
         we will divide the total number of adjacent hexes(max 3) by the amount of resources that are unique
         '''
 
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         total_diversity_score = 0
 
@@ -258,7 +261,7 @@ class dylanAIPlayer(player):
         max_prod_for_type["DESERT"] = 0
 
         # for each adjacent resource
-        for adjacentHex in board.boardGraph[settlement_location].adjacentHexList:
+        for adjacentHex in board.topology.vertexHexList[settlement_location]:
             resource_type = board.hexTileDict[adjacentHex].resource.type
 
             # add to the count of adjacent hexes and add the resource to the set of resources we've seen
@@ -278,8 +281,8 @@ class dylanAIPlayer(player):
                 production_points, max_prod_for_type[resource_type])
 
         if debug:
-            print("{} out of {} hexes are unique types. Total new production points provided: {}".format(
-                len(unique_resources_present), total_adjacent_hexes, total_diversity_score))
+            logger.debug("%s out of %s hexes are unique types. Total new production points provided: %s",
+                len(unique_resources_present), total_adjacent_hexes, total_diversity_score)
 
         total_diversity_score *= total_adjacent_hexes / \
             len(unique_resources_present)
@@ -300,10 +303,10 @@ class dylanAIPlayer(player):
         setup_synergy increases when the production points that the settlement provides
         help us balance out ratios for building things
         '''
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         total_score = 0
-        settlement_resources = board.boardGraph[settlement_location].adjacentHexList
+        settlement_resources = board.topology.vertexHexList[settlement_location]
         settlement_production_points = {}
 
         for resource in self.resourcePreferences:
@@ -322,7 +325,7 @@ class dylanAIPlayer(player):
                              self.resourcePreferences["BRICK"])
 
             if debug:
-                print("Benefiting WOOD-BRICK by {}".format(self_synergy))
+                logger.debug("Benefiting WOOD-BRICK by %s", self_synergy)
 
         elif "ORE" in settlement_resources and "WHEAT" in settlement_resources and "SHEEP" in settlement_resources:
             self_synergy += settlement_production_points["ORE"]
@@ -332,7 +335,7 @@ class dylanAIPlayer(player):
             self_synergy *= (self.resourcePreferences["ORE"] +
                              self.resourcePreferences["WHEAT"] + self.resourcePreferences["SHEEP"])
             if debug:
-                print("Benefiting ORE-WHEAT-SHEEP by {}".format(self_synergy))
+                logger.debug("Benefiting ORE-WHEAT-SHEEP by %s", self_synergy)
 
         elif "WHEAT" in settlement_resources and "SHEEP" in settlement_resources:
             self_synergy += settlement_production_points["WHEAT"]
@@ -341,7 +344,7 @@ class dylanAIPlayer(player):
             self_synergy *= (self.resourcePreferences["WHEAT"] +
                              self.resourcePreferences["SHEEP"])
             if debug:
-                print("Benefiting WHEAT-SHEEP by {}".format(self_synergy))
+                logger.debug("Benefiting WHEAT-SHEEP by %s", self_synergy)
 
         return self_synergy
 
@@ -405,7 +408,7 @@ class dylanAIPlayer(player):
             return total_score
 
     def move(self, board):
-        print("{}'s TURN...".format(self.name))
+        logger.info("%s's TURN...", self.name)
         '''
         Note: read the project report for a more legible and less technical explanation of this code.
 
@@ -460,7 +463,7 @@ class dylanAIPlayer(player):
             if we try for all of our options and cant do anything,
                 finish our turn
         '''
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
         # we may have already played a knight before rolling
         # may have rolled a 7 and moved the robber AND discarded cards
 
@@ -497,12 +500,12 @@ class dylanAIPlayer(player):
                     continue
 
                 if debug:
-                    print("{} desire: {}".format(option, move_goals[option]))
+                    logger.debug("%s desire: %s", option, move_goals[option])
 
                 # if we can do our option
                 if self.able_to_do(option, board):
                     if debug:
-                        print("Able to: {}".format(option))
+                        logger.debug("Able to: %s", option)
 
                     # do it
                     self.make_move(board, option)
@@ -514,7 +517,7 @@ class dylanAIPlayer(player):
                 elif self.able_to_trade_for(option):
                     # if we can trade for our option
                     if debug:
-                        print("Able to: {}".format(option))
+                        logger.debug("Able to: %s", option)
 
                     # make the trades
                     self.make_trades_for(option)
@@ -537,8 +540,7 @@ class dylanAIPlayer(player):
                             able_to_do_something = True
                             break
                         if debug:
-                            print(
-                                "Can't play roadbuilding for {}".format(option))
+                            logger.debug("Can't play roadbuilding for %s", option)
 
                     # if our current option is our first choice
                     if max(move_goals, key=move_goals.get) == option:
@@ -551,8 +553,7 @@ class dylanAIPlayer(player):
                                 able_to_do_something = True
                                 break
                             if debug:
-                                print(
-                                    "Can't use year of plenty for {}".format(option))
+                                logger.debug("Can't use year of plenty for %s", option)
 
                         # if we can play a monopoly
                         if self.can_play_monopoly():
@@ -562,8 +563,7 @@ class dylanAIPlayer(player):
                                 able_to_do_something = True
                                 break
                             if debug:
-                                print(
-                                    "Can't use monopoly for {}".format(option))
+                                logger.debug("Can't use monopoly for %s", option)
 
                     # if we have < 7 cards and couldnt play a dev card,
                     # discard lower rated options that will hinder our current goal
@@ -578,8 +578,8 @@ class dylanAIPlayer(player):
                     # while we have more than 7 cards, trade towards our highest rated option
                     while sum(self.resources.values()) > 7:
                         if debug:
-                            print("{} has {} cards, so it will attempt to trade for {}".format(
-                                self.name, sum(self.resources.values()), option))
+                            logger.debug("%s has %s cards, so it will attempt to trade for %s",
+                                self.name, sum(self.resources.values()), option)
                             
                         # if we have 7 or more cards, first try porting for a resource that will help us towards our goal.
                         if self.make_one_trade_for_option(option):
@@ -598,8 +598,8 @@ class dylanAIPlayer(player):
                                     options.remove(goal_to_remove)
                         else:
                             if debug:
-                                print("{} was unable to trade for {} and still has {} cards".format(
-                                    self.name, option, sum(self.resources.values())))
+                                logger.debug("%s was unable to trade for %s and still has %s cards",
+                                    self.name, option, sum(self.resources.values()))
                             # if we couldn't trade for something, then we can keep lower rated options in the queue
                             # cant trade or play any devs. just break
                             break
@@ -624,7 +624,7 @@ class dylanAIPlayer(player):
                                 break
                             else:
                                 if debug:
-                                    print("Tried to make a trade but was unable to")
+                                    logger.debug("Tried to make a trade but was unable to")
 
                     # if we couldnt trade for it continue to next option
                     continue
@@ -667,9 +667,8 @@ class dylanAIPlayer(player):
         returns int amount of resource that all other players have
         '''
         count = 0
-        for player in list(self.game.playerQueue.queue):
-            if player != self:
-                count += player.resources[resource]
+        for player in self.game.opponents[self.seat]:
+            count += player.resources[resource]
         return count
 
     def play_monopoly(self, option, board):
@@ -696,15 +695,14 @@ class dylanAIPlayer(player):
         resources_taken = 0
 
         # for each player
-        for player in list(self.game.playerQueue.queue):
-            if (player != self):
-                # take those cards
-                self.resources[best_resource] += player.resources[best_resource]
-                resources_taken += player.resources[best_resource]
-                player.resources[best_resource] = 0
-
-        print("Playing MONOPOLY. Stole {} {}".format(
-            resources_taken, best_resource))
+        for player in self.game.opponents[self.seat]:
+            # take those cards
+            self.resources[best_resource] += player.resources[best_resource]
+            resources_taken += player.resources[best_resource]
+            player.resources[best_resource] = 0
+
+        logger.info("Playing MONOPOLY. Stole %s %s",
+            resources_taken, best_resource)
         self.devCardPlayedThisTurn = True
         self.devCards["MONOPOLY"] -= 1
         return
@@ -747,7 +745,7 @@ class dylanAIPlayer(player):
         assumes we need exactly 2 resources, since that is the only time its called
         '''
 
-        print("{} playing YEAROFPLENTY...".format(self.name))
+        logger.info("%s playing YEAROFPLENTY...", self.name)
         resources_needed = self.get_resources_needed_for(option)
         resources_bought = 0
 
@@ -757,20 +755,20 @@ class dylanAIPlayer(player):
             
             if cost == 2:
                 self.resources[resource] += 2
-                print("Using YEAROFPLENTY for 2 {}".format(resource))
+                logger.info("Using YEAROFPLENTY for 2 %s", resource)
                 resources_bought += 2
             elif cost == 1:
                 self.resources[resource] += 1
-                print("Using YEAROFPLENTY for 1 {}".format(resource))
+                logger.info("Using YEAROFPLENTY for 1 %s", resource)
                 resources_bought += 1
 
         # NOTE: Code was changed so that YOP is only played when we need exactly 2 cards, so this shouldn't be reached OR needed anymore
         while resources_bought < 2:
             # TODO: DONT randomly pick a resource
             random_resource = list(self.resources.keys())[
-                np.random.randint(0, 5)]
+                self.game.board.rng.integers(0, 5)]
             self.resources[random_resource] += 1
-            print("Using YEAROFPLENTY for 1 {}".format(random_resource))
+            logger.info("Using YEAROFPLENTY for 1 %s", random_resource)
             resources_bought += 1
 
         self.devCardPlayedThisTurn = True
@@ -790,7 +788,7 @@ class dylanAIPlayer(player):
         road_builder = True flag makes sure that it places the roads for free
         '''
         if self.can_play_roadbuilder():
-            print("Playing ROADBUILDER")
+            logger.info("Playing ROADBUILDER")
             # place 2 free roads
             self.place_best_road(board, road_builder=True)
             self.place_best_road(board, road_builder=True)
@@ -813,7 +811,7 @@ class dylanAIPlayer(player):
         we cant build a settlement but we dont need to remove the option to build a road, since it wouldnt affect our
         ability to build 1 settlement in the future
         '''
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
         goals_to_remove = []
 
         # for each option
@@ -821,21 +819,21 @@ class dylanAIPlayer(player):
             # if its not our current goal or PLAY_DEV
             if option != current_goal or option == "PLAY_DEV":
                 if debug:
-                    print("Checking if {} conflicts with {}".format(
-                        option, current_goal))
+                    logger.debug("Checking if %s conflicts with %s",
+                        option, current_goal)
                     
                 # if we cant build it without breaking it
                 if not self.can_build_without_breaking(current_goal, option):
                     if debug:
-                        print("It did conflict")
+                        logger.debug("It did conflict")
                     goals_to_remove.append(option)
 
                 else:
                     if debug:
-                        print("It did not conflict")
+                        logger.debug("It did not conflict")
 
         if debug:
-            print()
+            logger.debug("")
 
         return goals_to_remove
 
@@ -853,7 +851,7 @@ class dylanAIPlayer(player):
         if breaking_option == "PLAY_DEV":
             return True
         
-        debug = False and build_option == "SETTLEMENT"
+        debug = logger.isEnabledFor(logging.DEBUG) and build_option == "SETTLEMENT"
 
         # dict from option to a DICT OF RESOURCE:NUMBER representing the cost for the option
         cost_of_build_option = self.option_to_resources_required_dict[build_option]
@@ -862,8 +860,8 @@ class dylanAIPlayer(player):
         cost_of_breaking_option = self.option_to_resources_required_dict[breaking_option]
 
         if debug:
-            print("Checking if {} conflicts with {}".format(
-                breaking_option, build_option))
+            logger.debug("Checking if %s conflicts with %s",
+                breaking_option, build_option)
 
         # for each resource
         for resource in cost_of_build_option.keys():
@@ -876,24 +874,24 @@ class dylanAIPlayer(player):
             # if we dont have the resource, then building anything cant decrease this below the threshold
             if required_amount == 0 or possible_breaking_amount == 0 or current_amount == 0:
                 if debug:
-                    print(" It does not conflict")
+                    logger.debug(" It does not conflict")
                 continue
 
             if debug:
-                print(" For {}, we have {} {}, we need {}, and want {} for {}".format(
-                    build_option, current_amount, resource, required_amount, possible_breaking_amount, breaking_option))
-                print(" If we built {}, we'd have {} remaining for {}".format(
-                    breaking_option, current_amount-possible_breaking_amount, build_option))
+                logger.debug(" For %s, we have %s %s, we need %s, and want %s for %s",
+                    build_option, current_amount, resource, required_amount, possible_breaking_amount, breaking_option)
+                logger.debug(" If we built %s, we'd have %s remaining for %s",
+                    breaking_option, current_amount-possible_breaking_amount, build_option)
 
             # if our current amount minus the cost of the breaking option is less than what we need for our
             # build option, it would break our resources for the build optoin
             if current_amount - possible_breaking_amount < required_amount:
                 if debug:
-                    print(" It DOES conflict")
+                    logger.debug(" It DOES conflict")
                 return False
 
             if debug:
-                print()
+                logger.debug("")
         return True
 
     def make_one_trade_for_option(self, option):
@@ -923,7 +921,7 @@ class dylanAIPlayer(player):
         '''
         This function will assign a "desire" rating for each of the 5 options. It does not take into account whether they are possible or not.
         '''
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
         goals = {"ROAD": 0, "SETTLEMENT": 0,
                  "CITY": 0, "BUY_DEV": 0}
 
@@ -934,8 +932,8 @@ class dylanAIPlayer(player):
 
         if debug:
             for item in goals.keys():
-                print("{} desire: {}".format(item, goals[item]))
-            print()
+                logger.debug("%s desire: %s", item, goals[item])
+            logger.debug("")
 
         return goals
 
@@ -968,17 +966,51 @@ class dylanAIPlayer(player):
         if setup:
             possible_roads = board.get_setup_roads(self)
 
-        best_road = max(possible_roads, key=lambda road: self.evaluate_road(
-            board, road, setup=setup))
+        road_utilities = self.evaluate_roads(board, list(possible_roads), setup=setup)
+        best_road = max(possible_roads, key=lambda road: road_utilities[road])
 
-        self.build_road(best_road[0], best_road[1],
-                        board, road_builder=road_builder)
+        self.build_road(best_road, board, road_builder=road_builder)
         return
 
-    def evaluate_road(self, board, road, debug=False, setup=False):
+    def evaluate_roads(self, board, roads, setup=False):
+        '''
+        evaluate a list of roads, return a dict of road: utility
+
+        the road lengths evaluate_road needs for each road are computed for all the roads in one batch,
+        so roads that lead to the same networks only search them once
+        '''
+        road_sets = [self.get_road_sets(board, road) for road in roads]
+
+        # only the single roads are needed if we can't take longest road
+        sets_per_road = 3 if self.can_take_longest_road() else 1
+        batch = []
+        for sets in road_sets:
+            batch.extend(sets[:sets_per_road])
+        road_lengths = self.road_lengths_if_added(board, batch)
+
+        return {road: self.evaluate_road(board, road, setup=setup, road_sets=road_sets[i],
+                                         road_lengths=road_lengths[i * sets_per_road:(i + 1) * sets_per_road])
+                for i, road in enumerate(roads)}
+
+    def get_road_sets(self, board, road):
+        '''
+        given a road, return the road sets evaluate_road looks at: [road], the one degree roads and the two degree roads
+        '''
+        # new roads that we can build given the current road
+        one_degree_roads = self.get_potential_roads_with(board, [road])
+
+        # new roads that we can build given the one_degree roads
+        two_degree_roads = self.get_potential_roads_with(
+            board, one_degree_roads)
+
+        return [road], one_degree_roads, two_degree_roads
+
+    def evaluate_road(self, board, road, debug=False, setup=False, road_sets=None, road_lengths=None):
         '''
         function to evaluate roads
 
+        road_sets and road_lengths can be passed in from evaluate_roads, otherwise they are computed here
+
 
         if it gives us longest road, apply some utility
             if it would give us longest road for the win, apply MAX utility
@@ -1007,43 +1039,42 @@ class dylanAIPlayer(player):
             increase_max_length_utility = 0
             longest_road_utility = 0
 
-        # new roads that we can build given the current road
-        one_degree_roads = self.get_potential_roads_with(board, [road])
-
-        # new roads that we can build given the one_degree roads
-        two_degree_roads = self.get_potential_roads_with(
-            board, one_degree_roads)
+        if road_sets is None:
+            road_sets = self.get_road_sets(board, road)
+        one_degree_roads, two_degree_roads = road_sets[1], road_sets[2]
 
         # if we can even take longest road
         if self.can_take_longest_road():
+            # our max road length with the road, with the one degree roads and with the two degree roads
+            if road_lengths is None or len(road_lengths) < 3:
+                road_lengths = self.road_lengths_if_added(board, road_sets)
+
             # if this road would do it
-            if self.would_give_us_longest(board, [road]):
+            if self.would_give_us_longest(board, [road], road_lengths[0]):
                 utility += longest_road_utility
 
                 if debug:
-                    print("Road gives us longest road. Utility {}".format(utility))
+                    logger.debug("Road gives us longest road. Utility %s", utility)
                 # if it gives us the win, just max it out
                 if self.max_points - self.victoryPoints <= 2:
                     utility += 1000
 
                     if debug:
-                        print(
-                            "Longest Road would give us the win. Utility {}".format(utility))
+                        logger.debug("Longest Road would give us the win. Utility %s", utility)
                     return utility
 
             # if it is possible to do in 2 roads
-            elif self.would_give_us_longest(board, one_degree_roads):
+            elif self.would_give_us_longest(board, one_degree_roads, road_lengths[1]):
                 utility += longest_road_utility * (0.6666)
                 if debug:
-                    print("Road gives us access to a road that would give us longest road. Utility {}".format(
-                        utility))
+                    logger.debug("Road gives us access to a road that would give us longest road. Utility %s",
+                        utility)
 
             # if it is possible to do in 3 roads
-            elif self.would_give_us_longest(board, two_degree_roads):
+            elif self.would_give_us_longest(board, two_degree_roads, road_lengths[2]):
                 utility += longest_road_utility * (0.3333)
                 if debug:
-                    print(
-                        "Road gives 3-degree access to longest road. Utility {}".format(utility))
+                    logger.debug("Road gives 3-degree access to longest road. Utility %s", utility)
 
         # if we can build more settlements, potential settlement spots should be taken into account
         if self.settlementsLeft >= 1:
@@ -1057,8 +1088,8 @@ class dylanAIPlayer(player):
                 utility += settlement_base_utility * \
                     self.evaluate_settlement(board, settlement)
                 if debug:
-                    print("Settlement Utility this road gives immediate access to: {}. Utility {}".format(
-                        self.evaluate_settlement(board, settlement), utility))
+                    logger.debug("Settlement Utility this road gives immediate access to: %s. Utility %s",
+                        self.evaluate_settlement(board, settlement), utility)
 
             # exclude 1-degree spots
             two_degree_settlement_spots = self.get_potential_settlemnt_spots_with_roads(
@@ -1079,8 +1110,8 @@ class dylanAIPlayer(player):
                     self.evaluate_settlement(board, best_settlement)
                 
                 if debug:
-                    print("Settlement Utility this road gives 2-degree access to: {}. Utility {}".format(
-                        self.evaluate_settlement(board, best_settlement), utility))
+                    logger.debug("Settlement Utility this road gives 2-degree access to: %s. Utility %s",
+                        self.evaluate_settlement(board, best_settlement), utility)
 
             # exclude 1-degree and 2-degree spots
             three_degree_settlement_spots = self.get_potential_settlemnt_spots_with_roads(
@@ -1102,18 +1133,18 @@ class dylanAIPlayer(player):
                     self.evaluate_settlement(board, best_settlement)
                 
                 if debug:
-                    print("Settlement Utility this road gives 3-degree access to: {}. Utility {}".format(
-                        self.evaluate_settlement(board, best_settlement), utility))
+                    logger.debug("Settlement Utility this road gives 3-degree access to: %s. Utility %s",
+                        self.evaluate_settlement(board, best_settlement), utility)
 
-        if self.would_increase_max_length(board, road):
+        if self.would_increase_max_length(board, road, road_lengths[0] if road_lengths else None):
             utility += increase_max_length_utility
             if debug:
-                print("Road would increase max length. Utility {}".format(utility))
+                logger.debug("Road would increase max length. Utility %s", utility)
         if debug:
-            print(one_degree_settlement_spots)
-            print(two_degree_settlement_spots)
-            print(three_degree_settlement_spots)
-            print()
+            logger.debug("%s", one_degree_settlement_spots)
+            logger.debug("%s", two_degree_settlement_spots)
+            logger.debug("%s", three_degree_settlement_spots)
+            logger.debug("")
 
         return utility
 
@@ -1122,54 +1153,22 @@ class dylanAIPlayer(player):
         given a list of roads, return only the NEW roads that we would be able to place if the given roads were built
         '''
 
-        # double check that we are only using roads that we didnt already build
-        new_roads = []
-        for road in roads:
-            if road not in self.buildGraph["ROADS"]:
-                new_roads.append(road)
-
-        # exclude any roads that we can already build
-        exclude_list = list(board.get_potential_roads(self))
-
-        # add the new roads to our build graph and boardgraph
-        for road in new_roads:
-            self.buildGraph["ROADS"].append(road)
-            board.updateBoardGraph_road(road[0], road[1], self)
-
-        new_potential_roads = list(board.get_potential_roads(self).keys())
-
-        # remove the new roads from our build graph
-        for road in new_roads:
-            self.buildGraph["ROADS"].remove(road)
-            board.remove_road_from_boardGraph(road[0], road[1])
+        # roads we already built don't open anything new, and the board works out the rest without building the roads
+        return board.getNewPotentialRoads(self, roads)
 
-        for road in exclude_list:
-            if road in new_potential_roads:
-                new_potential_roads.remove(road)
-
-        return new_potential_roads
-
-    def would_give_us_longest(self, board, roads):
+    def would_give_us_longest(self, board, roads, max_length=None):
         '''
         given a list of roads, return true if we would take longest road given the roads
+
+        max_length is our road length with the roads, if it is already known
         '''
         # if we can't take it, no roads would give us longest road
         if not self.can_take_longest_road():
             return False
 
-        # double check that we are only using roads that we didnt already build
-        new_roads = []
-        for road in roads:
-            if road not in self.buildGraph["ROADS"]:
-                new_roads.append(road)
-
-        # add the new roads to our build graph and boardgraph
-        for road in new_roads:
-            self.buildGraph["ROADS"].append(road)
-            board.updateBoardGraph_road(road[0], road[1], self)
-
-        # use built in function to get road length now
-        max_length = self.get_road_length(board)
+        # get our road length with the roads, without adding them to the board (roads we already built don't count twice)
+        if max_length is None:
+            max_length = self.road_length_if_added(board, roads)
 
         could_take_longest = False
         # has to be at least 5
@@ -1179,37 +1178,27 @@ class dylanAIPlayer(player):
             could_take_longest = True
 
             # check that no player has a longer or equal length road already 
-            for player in list(self.game.playerQueue.queue):
+            for player in self.game.opponents[self.seat]:
                 # if another player has the same or longer length, we dont have longest
-                if (player.maxRoadLength >= max_length and player != self):
+                if (player.maxRoadLength >= max_length):
                     could_take_longest = False
 
-        # remove the new roads from our build graph
-        for road in new_roads:
-            self.buildGraph["ROADS"].remove(road)
-            board.remove_road_from_boardGraph(road[0], road[1])
-
         return could_take_longest
 
-    def would_increase_max_length(self, board, road):
+    def would_increase_max_length(self, board, road, max_length=None):
         '''
         given a single road, return true if it increases our max length
+
+        max_length is our road length with the road, if it is already known
         '''
         # double check that the road hasn't already been build
 
         if road in self.buildGraph["ROADS"]:
             return False
 
-        # add the road to our build and board graph
-        self.buildGraph["ROADS"].append(road)
-        board.updateBoardGraph_road(road[0], road[1], self)
-
-        # use builnt in function to get road length
-        max_length = self.get_road_length(board)
-
-        # remove hypothetical road
-        self.buildGraph["ROADS"].remove(road)
-        board.remove_road_from_boardGraph(road[0], road[1])
+        # get our road length with the road, without adding it to the board
+        if max_length is None:
+            max_length = self.road_length_if_added(board, road)
 
         # check if our length has increased
         return max_length > self.maxRoadLength
@@ -1231,16 +1220,14 @@ class dylanAIPlayer(player):
 
         # add the new roads to our build graph and boardgraph
         for road in new_roads:
-            self.buildGraph["ROADS"].append(road)
-            board.updateBoardGraph_road(road[0], road[1], self)
+            board.apply(('ROAD', road, self))
 
         # use built in function to get potential settlements
         new_settlements = list(board.get_potential_settlements(self).keys())
 
         # remove the new roads from our build graph and boardgraph
         for road in new_roads:
-            self.buildGraph["ROADS"].remove(road)
-            board.remove_road_from_boardGraph(road[0], road[1])
+            board.undo()
 
         # remove settlements we already had
         for settlement in exclude_list:
@@ -1363,7 +1350,7 @@ class dylanAIPlayer(player):
             utility = 999
             return utility
 
-        return max(self.evaluate_road(board, road) for road in board.get_potential_roads(self))
+        return max(self.evaluate_roads(board, list(board.get_potential_roads(self))).values())
 
     def can_take_longest_road(self):
         '''
@@ -1387,10 +1374,9 @@ class dylanAIPlayer(player):
 
         current_longest_road_length = 0
 
-        for player in list(self.game.playerQueue.queue):
-            if player != self:
-                current_longest_road_length = max(
-                    current_longest_road_length, player.maxRoadLength)
+        for player in self.game.opponents[self.seat]:
+            current_longest_road_length = max(
+                current_longest_road_length, player.maxRoadLength)
 
         # if our current length + the amount of roads we can buy is more than the current longest road, then we can take it
         return current_longest_road_length < self.maxRoadLength + self.number_of_roads_we_can_buy()
@@ -1470,11 +1456,11 @@ class dylanAIPlayer(player):
             return 0
 
         # if we have no dev cards outside of vps, we want at least 1
-        if sum(self.devCards.values()) + len(self.newDevCards) <= self.devCards["VP"]:
+        if sum(self.devCards.values()) + sum(self.newDevCards.values()) <= self.devCards["VP"]:
             utility += 5
 
         # if we specifically have no knights as well add some value
-        if self.devCards["KNIGHT"] == 0 and "KNIGHT" not in self.newDevCards:
+        if self.devCards["KNIGHT"] == 0 and self.newDevCards["KNIGHT"] == 0:
             utility += 5
 
         return utility
@@ -1524,7 +1510,7 @@ class dylanAIPlayer(player):
         returns true if it is possible
         '''
 
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # make a copy of our current resources that will be used to calculate if we can trade for it
         theoretical_resources = copy.deepcopy(self.resources)
@@ -1540,7 +1526,7 @@ class dylanAIPlayer(player):
         # while any theoretical resource is negative
         while not all(theoretical_resources[resource] >= 0 for resource in theoretical_resources):
             if debug:
-                print(theoretical_resources)
+                logger.debug("%s", theoretical_resources)
 
             has_traded = False
 
@@ -1551,8 +1537,8 @@ class dylanAIPlayer(player):
                 if port[:3] == "2:1":
                     port_resource_type = port[4:]
                     if debug:
-                        print("Checking 2:1 {} options...".format(
-                            port_resource_type))
+                        logger.debug("Checking 2:1 %s options...",
+                            port_resource_type)
 
                     # if we have 2 of the item remaining
                     if theoretical_resources[port_resource_type] >= 2:
@@ -1574,7 +1560,7 @@ class dylanAIPlayer(player):
 
                 if port[:3] == "3:1":
                     if debug:
-                        print("Checking 3:1 options...")
+                        logger.debug("Checking 3:1 options...")
                     # go through each resource
                     for trade_resource in theoretical_resources:
 
@@ -1604,7 +1590,7 @@ class dylanAIPlayer(player):
             # go through each resource
             for trade_resource in theoretical_resources:
                 if debug:
-                    print("Checking 4:1 for {} options...".format(trade_resource))
+                    logger.debug("Checking 4:1 for %s options...", trade_resource)
 
                 # if we have 4 of the item
                 if theoretical_resources[trade_resource] >= 4:
@@ -1647,7 +1633,7 @@ class dylanAIPlayer(player):
         IMPROVEMENT: prioritize which item to trade differently
         '''
 
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # copy our resources to aid in calculation
         theoretical_resources = copy.deepcopy(self.resources)
@@ -1659,7 +1645,7 @@ class dylanAIPlayer(player):
         # while we can't pay for the desired item
         while not all(theoretical_resources[resource] >= 0 for resource in theoretical_resources):
             if debug:
-                print(theoretical_resources)
+                logger.debug("%s", theoretical_resources)
 
             has_traded = False
 
@@ -1697,7 +1683,7 @@ class dylanAIPlayer(player):
 
                 if port[:3] == "3:1":
                     if debug:
-                        print("Checking 3:1 options...")
+                        logger.debug("Checking 3:1 options...")
                     # go through each resource
                     for trade_resource in theoretical_resources:
 
@@ -1736,7 +1722,7 @@ class dylanAIPlayer(player):
             # go through each resource
             for trade_resource in theoretical_resources:
                 if debug:
-                    print("Checking 4:1 for {} options...".format(trade_resource))
+                    logger.debug("Checking 4:1 for %s options...", trade_resource)
 
                 # if we have 4 of the item
                 if theoretical_resources[trade_resource] >= 4:
@@ -1792,7 +1778,7 @@ class dylanAIPlayer(player):
             # discard, so we should only do it most of the time
             if sum(self.resources.values()) == 7:
                 # return true 5/6 times
-                return np.random.randint(0, 36) >= 6
+                return board.rng.integers(0, 36) >= 6
             else:
                 # play knight
                 return True
@@ -1818,7 +1804,7 @@ class dylanAIPlayer(player):
             return True
 
         # if anyone has more knights than us
-        for p in list(self.game.playerQueue.queue):
+        for p in self.game.players:
             # NOTE: doesn't take into account if we should ever give up and not play the knight
             if (p.knightsPlayed > self.knightsPlayed):
                 return True
@@ -1829,7 +1815,7 @@ class dylanAIPlayer(player):
             # if we have already played at least 2 knights
             if self.knightsPlayed >= 2:
                 # and every other player has AT MOST the same amount of knights:
-                for p in list(self.game.playerQueue.queue):
+                for p in self.game.players:
                     # if any other player has strictly more knights than us, we wont take largest army
                     if (p.knightsPlayed > self.knightsPlayed):
                         play_flag = False
@@ -1839,7 +1825,7 @@ class dylanAIPlayer(player):
             return True
 
         # if we are tied with anyone in number of knights who has a dev card, play a knight
-        for p in list(self.game.playerQueue.queue):
+        for p in self.game.players:
             if (p.knightsPlayed == self.knightsPlayed) and (sum(p.devCards.values()) >= 1):
                 return True
 
@@ -1855,11 +1841,11 @@ class dylanAIPlayer(player):
         its own production points times the number of settlements adjacent to it. (+1 for cities)
         
         '''
-        print("{} is moving the robber...".format(self.name))
+        logger.info("%s is moving the robber...", self.name)
 
-        debug = True
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        all_players = list(self.game.playerQueue.queue)
+        all_players = list(self.game.players)
 
         # in order of number of victory points
         # NOTE: AI is currently cheating by knowing whether people have hidden VP dev cards
@@ -1898,8 +1884,8 @@ class dylanAIPlayer(player):
                 if opp_hex in valid_robber_spots:
 
                     if debug:
-                        print("Moving to hex {}. Production blocked: {}".format(
-                            opp_hex, self.get_opponent_production_for_hex(board, opp_hex)))
+                        logger.debug("Moving to hex %s. Production blocked: %s",
+                            opp_hex, self.get_opponent_production_for_hex(board, opp_hex))
 
                     self.move_robber(opp_hex, board, player)
                     return
@@ -1914,7 +1900,7 @@ class dylanAIPlayer(player):
                     if sum(player.resources.values()) > 0 or all_have_zero:
 
                         if debug:
-                            print("Attempting to rob from {}".format(player.name))
+                            logger.debug("Attempting to rob from %s", player.name)
 
                         opponent_adjacent_hexes = self.get_adjacent_hexes_for_player(
                             board, player, exclude_selves=True)
@@ -1925,8 +1911,8 @@ class dylanAIPlayer(player):
                             if opp_hex in valid_robber_spots:
 
                                 if debug:
-                                    print("Moving to hex {}. Production blocked: {}".format(
-                                        opp_hex, self.get_opponent_production_for_hex(board, opp_hex)))
+                                    logger.debug("Moving to hex %s. Production blocked: %s",
+                                        opp_hex, self.get_opponent_production_for_hex(board, opp_hex))
 
                                 self.move_robber(opp_hex, board, player)
                                 return
@@ -1948,14 +1934,14 @@ class dylanAIPlayer(player):
         '''
         hexes = []
         for settlement in player.buildGraph["SETTLEMENTS"]:
-            for adj_hex in board.boardGraph[settlement].adjacentHexList:
+            for adj_hex in board.topology.vertexHexList[settlement]:
                 if adj_hex not in hexes:
                     hexes.append(adj_hex)
 
         # if we want to exclude any tiles adjacent to us
         if exclude_selves:
             for settlement in self.buildGraph["SETTLEMENTS"]:
-                for adj_hex in board.boardGraph[settlement].adjacentHexList:
+                for adj_hex in board.topology.vertexHexList[settlement]:
                     if adj_hex in hexes:
                         hexes.remove(adj_hex)
 
@@ -1972,28 +1958,23 @@ class dylanAIPlayer(player):
         base_prod_points = self.production_points_for_hex(board, opp_hex)
 
         # for each player
-        for player in list(self.game.playerQueue.queue):
+        for player in self.game.players:
 
             # for each of their settlements
             for settlement in player.buildGraph["SETTLEMENTS"]:
 
                 # if the hex is adjacent to t=it
-                if opp_hex in board.boardGraph[settlement].adjacentHexList:
+                if opp_hex in board.topology.vertexHexList[settlement]:
 
                     output += base_prod_points
 
-                    # if it is a city, double it
-                    if opp_hex in player.buildGraph["CITIES"]:
-                        output += base_prod_points
-
         return output
 
     def all_opponents_tied_for_vps(self):
         '''
         return true if all of our opponents have the same amount of true vps
         '''
-        all_opponents = list(self.game.playerQueue.queue)
-        all_opponents.remove(self)
+        all_opponents = self.game.opponents[self.seat]
 
         all_vps = [player.victoryPoints for player in all_opponents]
 
@@ -2015,7 +1996,7 @@ class dylanAIPlayer(player):
         if self.devCardPlayedThisTurn:
             return
 
-        print("{} is playing a KNIGHT...".format(self.name))
+        logger.info("%s is playing a KNIGHT...", self.name)
 
         self.place_robber(board)
         self.devCardPlayedThisTurn = True
@@ -2035,7 +2016,7 @@ class dylanAIPlayer(player):
         return true if we have a settlement adjacent to the given hex
         '''
         for settlement in self.buildGraph["SETTLEMENTS"]:
-            for adj_hex in board.boardGraph[settlement].adjacentHexList:
+            for adj_hex in board.topology.vertexHexList[settlement]:
                 if adj_hex == adjacent_hex:
                     return True
 
@@ -2046,9 +2027,8 @@ class dylanAIPlayer(player):
         return true if any of our settlements have an adjacent hex blocked by the robber
         '''
         for settlement in self.buildGraph["SETTLEMENTS"]:
-            for adj_hex in board.boardGraph[settlement].adjacentHexList:
-                if (board.hexTileDict[adj_hex].robber == True):
-                    return True
+            if board.robberHex in board.topology.vertexHexList[settlement]:
+                return True
         return False
 
     def discard_cards(self, board):
@@ -2065,14 +2045,14 @@ class dylanAIPlayer(player):
         amount_to_discard = int(sum(self.resources.values()) / 2)
 
         if sum(self.resources.values()) > 7:
-            print("\nPlayer {} has {} cards and needs to discard {} cards!".format(
-                self.name, sum(self.resources.values()), amount_to_discard))
-            print("{} discarding resources...".format(self.name))
+            logger.info("\nPlayer %s has %s cards and needs to discard %s cards!",
+                self.name, sum(self.resources.values()), amount_to_discard)
+            logger.info("%s discarding resources...", self.name)
             for i in range(amount_to_discard):
                 self.discard_one_card_with_goal(goal)
         else:
-            print("\nPlayer {} has {} cards and does not need to discard any cards!".format(
-                self.name, sum(self.resources.values())))
+            logger.info("\nPlayer %s has %s cards and does not need to discard any cards!",
+                self.name, sum(self.resources.values()))
             return
 
     def discard_one_card_with_goal(self, goal):
@@ -2100,7 +2080,7 @@ class dylanAIPlayer(player):
         for resource in preferred:
             # try to discard 1
             if self.resources[resource] > 0:
-                print("{} discarding 1 {}".format(self.name, resource))
+                logger.info("%s discarding 1 %s", self.name, resource)
                 self.resources[resource] -= 1
 
                 # return if we do discard
@@ -2115,7 +2095,7 @@ class dylanAIPlayer(player):
         for resource in preferred:
             # try to discard 1
             if self.resources[resource] > 0:
-                print("{} discarding 1 {}".format(self.name, resource))
+                logger.info("%s discarding 1 %s", self.name, resource)
                 self.resources[resource] -= 1
 
                 # return. this should always eventually return because we should never have called this with <7 cards
@@ -2131,11 +2111,10 @@ class dylanAIPlayer(player):
 
         skips if it cant offer anything or requests nothing
         '''
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # Select player to trade with - generate list of other players
-        players = [p for p in list(self.game.playerQueue.queue)]
-        players.remove(self)
+        players = self.game.opponents[self.seat]
 
         # create a trade offer
         resources_to_give, resources_to_receive = self.create_trade_offer(option)
@@ -2144,22 +2123,23 @@ class dylanAIPlayer(player):
         if sum(resources_to_give.values()) == 0 or sum(resources_to_receive.values()) == 0 or sum(self.resources.values()) == 0:
             return False
         
-        # create a string for printing the offered/requested resources
+        # create a string for printing the offered/requested resources - only needed for the log or to ask a human player
         offered_resources_string = ""
         requested_resources_string = ""
-        for resource in resources_to_give.keys():
-            give_amount = resources_to_give[resource]
-            receive_amount = resources_to_receive[resource]
-            if give_amount > 0:
-                offered_resources_string += "{} {}, ".format(
-                    give_amount, resource)
-            if receive_amount > 0:
-                requested_resources_string += "{} {}, ".format(
-                    receive_amount, resource)
-        offered_resources_string = offered_resources_string[:-2]
-        requested_resources_string = requested_resources_string[:-2]
-
-        print("{} is offering {} for {}".format(self.name, offered_resources_string, requested_resources_string))
+        if logger.isEnabledFor(logging.INFO) or not all(other_player.isAI for other_player in players):
+            for resource in resources_to_give.keys():
+                give_amount = resources_to_give[resource]
+                receive_amount = resources_to_receive[resource]
+                if give_amount > 0:
+                    offered_resources_string += "{} {}, ".format(
+                        give_amount, resource)
+                if receive_amount > 0:
+                    requested_resources_string += "{} {}, ".format(
+                        receive_amount, resource)
+            offered_resources_string = offered_resources_string[:-2]
+            requested_resources_string = requested_resources_string[:-2]
+
+        logger.info("%s is offering %s for %s", self.name, offered_resources_string, requested_resources_string)
 
         if debug:
             self.print_player_info()
@@ -2181,12 +2161,12 @@ class dylanAIPlayer(player):
 
                         other_player.resources[resource] += give_amount
                         other_player.resources[resource] -= receive_amount
-                        print("{} successfully traded {} for {} with {}".format(
-                            self.name, offered_resources_string, requested_resources_string, other_player.name))
+                        logger.info("%s successfully traded %s for %s with %s",
+                            self.name, offered_resources_string, requested_resources_string, other_player.name)
                         return True
                 else:
-                    print("{} rejected trade giving {} for {}".format(
-                        other_player.name, offered_resources_string, requested_resources_string))
+                    logger.info("%s rejected trade giving %s for %s",
+                        other_player.name, offered_resources_string, requested_resources_string)
                     continue
 
             else:
@@ -2219,13 +2199,13 @@ class dylanAIPlayer(player):
 
                         other_player.resources[resource] += give_amount
                         other_player.resources[resource] -= receive_amount
-                    print("{} successfully traded {} for {} with {}".format(
-                        self.name, offered_resources_string, requested_resources_string, other_player.name))
+                    logger.info("%s successfully traded %s for %s with %s",
+                        self.name, offered_resources_string, requested_resources_string, other_player.name)
                     return True
                 else:
                     # rejected
-                    print("{} rejected trade giving {} for {}".format(
-                        other_player.name, offered_resources_string, requested_resources_string))
+                    logger.info("%s rejected trade giving %s for %s",
+                        other_player.name, offered_resources_string, requested_resources_string)
         return False
 
     def create_trade_offer(self, option):
@@ -2245,7 +2225,7 @@ class dylanAIPlayer(player):
         
         # shuffle the order
         resource_list = list(resources_needed.keys())
-        np.random.shuffle(resource_list)
+        self.game.board.rng.shuffle(resource_list)
 
         for resource in resource_list:
             # for our current option, request something we need
@@ -2327,14 +2307,14 @@ class dylanAIPlayer(player):
 
         return true if we can build our breaking option and we have not gone below what cards are needed for the build option
         '''
-        debug = False
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         # dict from option to a DICT OF RESOURCE:NUMBER representing the cost for the option
         cost_of_build_option = self.option_to_resources_required_dict[build_option]
 
         if debug:
-            print("Checking if {} conflicts with {}".format(
-                resources_to_give, build_option))
+            logger.debug("Checking if %s conflicts with %s",
+                resources_to_give, build_option)
 
         # for each resource
         for resource in cost_of_build_option.keys():
@@ -2347,22 +2327,22 @@ class dylanAIPlayer(player):
             # if we dont have the resource, then building anything cant decrease this below the threshold
             if required_amount == 0 or possible_breaking_amount == 0 or current_amount == 0:
                 if debug:
-                    print(" It does not conflict")
+                    logger.debug(" It does not conflict")
                 continue
 
             if debug:
-                print(" For {}, we have {} {}, we need {}, and want {} of {}".format(
-                    build_option, current_amount, resource, required_amount, possible_breaking_amount, resource))
-                print(" If we made the trade, we'd have {} {} remaining for {}".format(
-                    current_amount-possible_breaking_amount, resource, build_option))
+                logger.debug(" For %s, we have %s %s, we need %s, and want %s of %s",
+                    build_option, current_amount, resource, required_amount, possible_breaking_amount, resource)
+                logger.debug(" If we made the trade, we'd have %s %s remaining for %s",
+                    current_amount-possible_breaking_amount, resource, build_option)
 
             # if our current amount minus the cost of the breaking option is less than what we need for our
             # build option, it would break our resources for the build optoin
             if current_amount - possible_breaking_amount < required_amount:
                 if debug:
-                    print(" It DOES conflict")
+                    logger.debug(" It DOES conflict")
                 return False
 
             if debug:
-                print()
+                logger.debug("")
         return True
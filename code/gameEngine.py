@@ -0,0 +1,360 @@
+# Settlers of Catan
+# Headless game engine - runs the rules of a full game without pygame, stdin or sleeps
+
+from board import *
+from player import *
+from dylanAIPlayer import *
+import logging
+
+logger = logging.getLogger('catan.gameEngine')
+
+# Catan game engine class definition
+# Front ends (like the pygame catanGame) subclass the engine to take human decisions,
+# and follow the game through events sent to listeners added with addListener
+
+
+class catanGameEngine():
+    # Front ends that take the human player's moves set this, see build, robber and play_human_turn
+    hasFrontEnd = False
+
+    # Create new gameboard
+    # seed is passed on to the board, which owns the random number generator of the game
+    # aiParams is an optional list with a dict of dylanAIPlayer.updateAI keyword arguments for each seat
+    def __init__(self, numPlayers=4, seed=345678765, maxPoints=10, aiParams=None):
+        self.board = catanBoard(seed)
+
+        # Game State variables
+        self.gameOver = False
+        self.maxPoints = maxPoints
+        self.numPlayers = numPlayers
+        self.player_position = -1  # Seat of the human player, -1 for AI only games
+        self.hide_ai_cards = False
+        self.winner = None
+        self.turnCount = 0  # Number of player turns played
+        self.aiParams = aiParams
+
+        # Players indexed by seat, the other players of each seat, and the seat whose turn it is
+        self.players = []
+        self.opponents = []
+        self.currentTurn = 0
+        self.gameSetup = True  # Boolean to take care of setup phase
+
+        # Holders of longest road and largest army, and the road length/knight count needed to take them
+        self.longestRoadHolder = None
+        self.longestRoadLength = 4
+        self.largestArmyHolder = None
+        self.largestArmySize = 2
+
+        # Functions called on every game event as listener(event, player, info)
+        # Events: 'SETUP_PLACED', 'DICE_ROLLED' (info is the roll), 'ROBBER_MOVED', 'TURN_END', 'GAME_OVER'
+        self.listeners = []
+
+    # Function to add a listener for game events
+    def addListener(self, listener):
+        self.listeners.append(listener)
+
+    # Function to send a game event to all listeners
+    def emit(self, event, player, info=None):
+        for listener in self.listeners:
+            listener(event, player, info)
+
+    # Function to initialize players + build initial settlements for players
+
+    def build_initial_settlements(self):
+        # Only a front end can seat a human player - check before any player is created
+        if (not self.hasFrontEnd and self.player_position in range(self.numPlayers)):
+            raise ValueError("Seat {} is a human player, which needs a front end like catanGame".format(self.player_position + 1))
+
+        # Initialize new players with names and colors
+        playerColors = ['black', 'blue', 'magenta4', 'orange1']
+        translated_player_colors = ['Black', 'Blue', 'Purple', 'Orange']
+
+        self.players = []
+        for i in range(self.numPlayers):
+            if i == self.player_position:
+                playerNameInput = "YOU"
+                logger.info("Added new Player: %s", playerNameInput)
+                newPlayer = player(
+                    playerNameInput, playerColors[i], self.maxPoints, seat=i)
+                self.players.append(newPlayer)
+            else:
+                # add AI player
+                test_AI_player = dylanAIPlayer(
+                    'AI-{}'.format(translated_player_colors[i]), playerColors[i], self.maxPoints, seat=i)
+                if self.aiParams is not None:
+                    test_AI_player.updateAI(self, **self.aiParams[i])
+                else:
+                    test_AI_player.updateAI(self)
+                self.players.append(test_AI_player)
+
+        # Opponent lists in seat order, so AI players don't rebuild them every time they look at the others
+        self.opponents = [[p for p in self.players if p is not player_i] for player_i in self.players]
+
+        # Build Settlements and roads of each player forwards
+        for player_i in self.players:
+            self.place_initial_settlement(player_i)
+
+        # Build Settlements and roads of each player reverse
+        for player_i in reversed(self.players):
+            self.place_initial_settlement(player_i)
+
+            # Initial resource generation
+            # check each adjacent hex to latest settlement
+            for adjacentHex in self.board.topology.vertexHexList[player_i.buildGraph['SETTLEMENTS'][-1]]:
+                resourceGenerated = self.board.hexTileDict[adjacentHex].resource.type
+                if (resourceGenerated != 'DESERT'):
+                    player_i.resources[resourceGenerated] += 1
+                    logger.info("%s collects 1 %s from Settlement",
+                        player_i.name, resourceGenerated)
+
+        self.gameSetup = False
+
+        return
+
+    # Function for a player to place one settlement and road during setup
+    def place_initial_settlement(self, player_i):
+        if (player_i.isAI):
+            # AI player calls initial setup to place its first settlements and roads
+            player_i.initial_setup(self.board)
+            self.emit('SETUP_PLACED', player_i)
+
+        else:
+            self.build(player_i, 'SETTLE')
+            self.emit('SETUP_PLACED', player_i)
+
+            self.build(player_i, 'ROAD')
+            self.emit('SETUP_PLACED', player_i)
+
+    # Front end hooks - a human player chooses where to build, where to move the robber and how to play a turn
+    # in a front end (see catanGame), which overrides these and sets hasFrontEnd
+    # The engine only calls them for human seats, and build_initial_settlements won't seat a human without a front end,
+    # so they only raise if a front end forgets to override one
+
+    def build(self, player, build_flag, road_builder=False):
+        raise NotImplementedError("Building for a human player requires a front end")
+
+    def robber(self, player):
+        raise NotImplementedError("Moving the robber for a human player requires a front end")
+
+    def play_human_turn(self, currPlayer):
+        raise NotImplementedError("A human player's turn requires a front end")
+
+    # Function to roll dice
+
+    def rollDice(self):
+        dice_1 = int(self.board.rng.integers(1, 7))
+        dice_2 = int(self.board.rng.integers(1, 7))
+        diceRoll = dice_1 + dice_2
+        logger.info("Dice Roll = %s { %s %s }", diceRoll, dice_1, dice_2)
+
+        return diceRoll
+
+    # Function to update resources for all players
+    def update_playerResources(self, diceRoll, currentPlayer):
+        self.emit('DICE_ROLLED', currentPlayer, diceRoll)
+
+        if (diceRoll != 7):  # Collect resources if not a 7
+            # Resources each player collects for this number, kept up to date by the board
+            rollProduction = self.board.rollProduction[diceRoll]
+
+            # Check for each player
+            for i in range(self.numPlayers):
+                player_i = self.players[i]
+                # Settlements collect 1 and cities 2 from each adjacent hex without the robber
+                for resourceGenerated, amount in rollProduction.get(player_i, {}).items():
+                    player_i.resources[resourceGenerated] += amount
+                    logger.info("%s collects %s %s",
+                        player_i.name, amount, resourceGenerated)
+
+                # DYLAN UPDATING PRINTING TO HIDE OPPONENT CARDS
+                if logger.isEnabledFor(logging.INFO):
+                    if not self.hide_ai_cards or i == self.player_position:
+                        player_i.print_player_info(resources=True, true_vp=True, dev_cards=True, buildings_left=True, road_and_army_info=True)
+                    else:
+                        player_i.print_player_info(resources=False, true_vp=False, dev_cards=False, buildings_left=False, road_and_army_info=True)
+
+
+        # Logic for a 7 roll
+        else:
+            # Implement discarding cards
+            # Check for each player
+            for player_i in self.players:
+                if (player_i.isAI):
+                    player_i.discard_cards(self.board)
+
+                else:
+                    # Player must discard resources
+                    player_i.discardResources()
+
+            # Logic for robber
+            if (currentPlayer.isAI):
+                currentPlayer.place_robber(self.board)
+            else:
+                self.robber(currentPlayer)
+            self.emit('ROBBER_MOVED', currentPlayer)
+
+        # print current_player last always
+        if logger.isEnabledFor(logging.INFO):
+            if not currentPlayer.isAI or not self.hide_ai_cards:
+                currentPlayer.print_player_info()
+            else:
+                currentPlayer.print_player_info(resources=False, true_vp=False, dev_cards=False, buildings_left=False, road_and_army_info=True)
+
+    # function to check if a player has the longest road - after building latest road
+    # Only the holder and the length to beat are compared - other players are only looked at
+    # when the holder's road was cut by a settlement since the last check, or while the card is set aside after a tie
+    def check_longest_road(self, player_i):
+        holder = self.longestRoadHolder
+        if (holder is None and self.longestRoadLength >= 5):  # A cut may have broken the tie the card was set aside for
+            self.reassign_longest_road()
+        elif (holder is not None and holder.maxRoadLength < self.longestRoadLength):
+            self.reassign_longest_road()
+
+        if (player_i is self.longestRoadHolder):
+            self.longestRoadLength = player_i.maxRoadLength  # Holder extended their road
+        elif (player_i.maxRoadLength > self.longestRoadLength):  # At least 5 roads and longer than the holder's
+            self.set_longest_road(player_i, player_i.maxRoadLength)
+
+    # function to give longest road to whoever has the longest road after a cut
+    # The holder keeps it while still tied for longest, and it is set aside if other players tie or nobody has 5 roads
+    # A card that is already set aside goes to a player left alone with the longest road
+    def reassign_longest_road(self):
+        holder = self.longestRoadHolder
+        longest = max(p.maxRoadLength for p in self.players)
+        if (holder is not None and holder.maxRoadLength == longest and longest >= 5):
+            self.longestRoadLength = longest
+            return
+
+        longestPlayers = [p for p in self.players if p.maxRoadLength == longest]
+        if (longest >= 5 and len(longestPlayers) == 1):
+            self.set_longest_road(longestPlayers[0], longest)
+        elif (holder is None):
+            self.longestRoadLength = max(longest, 4)  # Still set aside, the tied length is the one to beat
+        else:
+            self.set_longest_road(None, max(longest, 4))
+
+    # function to move longest road from its holder to newHolder (None to set it aside)
+    # length is the road length other players have to beat to take it
+    def set_longest_road(self, newHolder, length):
+        prevHolder = self.longestRoadHolder
+        prevPlayer = ''
+        if (prevHolder is not None):
+            prevHolder.longestRoadFlag = False
+            prevPlayer = 'from Player ' + prevHolder.name
+
+        if (newHolder is not None):
+            newHolder.longestRoadFlag = True
+            logger.info("Player %s takes Longest Road %s",
+                newHolder.name, prevPlayer)
+        else:
+            logger.info("Longest Road is set aside %s", prevPlayer)
+
+        self.move_card_points(prevHolder, newHolder)
+        self.longestRoadHolder = newHolder
+        self.longestRoadLength = length
+
+    # function to check if a player has the largest army - after playing latest knight
+    # Knights played never go down, so only the holder and their knight count are compared
+    def check_largest_army(self, player_i):
+        if (player_i is self.largestArmyHolder):
+            self.largestArmySize = player_i.knightsPlayed  # Holder played more knights
+        elif (player_i.knightsPlayed > self.largestArmySize):  # At least 3 knights and more than the holder's
+            prevHolder = self.largestArmyHolder
+            prevPlayer = ''
+            if (prevHolder is not None):
+                prevHolder.largestArmyFlag = False
+                prevPlayer = 'from Player ' + prevHolder.name
+
+            player_i.largestArmyFlag = True
+            logger.info("Player %s takes Largest Army %s",
+                player_i.name, prevPlayer)
+
+            self.move_card_points(prevHolder, player_i)
+            self.largestArmyHolder = player_i
+            self.largestArmySize = player_i.knightsPlayed
+
+    # function to move the 2 victory points of longest road or largest army from one player to another
+    # Either can be None, when the card is taken for the first time or set aside
+    def move_card_points(self, prevHolder, newHolder):
+        if (prevHolder is not None):
+            prevHolder.victoryPoints -= 2
+            prevHolder.visibleVictoryPoints -= 2
+        if (newHolder is not None):
+            newHolder.victoryPoints += 2
+            newHolder.visibleVictoryPoints += 2
+
+    # function to get the Zobrist hash of the current position - robber, buildings, roads, hands and dev cards (held and bought this turn)
+    def get_position_hash(self):
+        positionHash = self.board.zobristHash
+        for player_i in self.players:
+            positionHash ^= player_i.resources.zobristHash ^ player_i.devCards.zobristHash ^ player_i.newDevCards.zobristHash
+        return positionHash
+
+    # Function for an AI player to play its whole turn
+    def play_ai_turn(self, currPlayer):
+        # check if AI wants to play a knight before rolling
+        if currPlayer.should_play_knight_before_rolling(self.board):
+            logger.info("%s is playing a knight",
+                currPlayer.name)
+            currPlayer.play_knight(self.board)
+
+        # roll Dice
+        diceNum = self.rollDice()
+        self.update_playerResources(diceNum, currPlayer)
+
+        # AI Player makes all its moves
+        currPlayer.move(self.board)
+
+        # Check if AI player gets longest road/largest army and update Victory points
+        self.check_longest_road(currPlayer)
+        self.check_largest_army(currPlayer)
+
+        if logger.isEnabledFor(logging.INFO):
+            if self.hide_ai_cards:
+                currPlayer.print_player_info(resources=False, true_vp=False, dev_cards=False, buildings_left=False, road_and_army_info=True)
+            else:
+                currPlayer.print_player_info()
+
+    # Function that runs the main game loop with all players and pieces
+    # Stops without a winner after maxTurns player turns if given
+    # Returns the winning player
+    def playCatan(self, maxTurns=None):
+        if (self.gameSetup):  # Place the initial settlements first if a front end hasn't already
+            self.build_initial_settlements()
+
+        while (self.gameOver == False):
+            if (maxTurns is not None and self.turnCount >= maxTurns):
+                logger.info("Stopping game after %s turns", self.turnCount)
+                self.gameOver = True
+                break
+
+            currPlayer = self.players[self.currentTurn]
+            self.turnCount += 1
+
+            logger.info("---------------------------------------------------------------------------")
+            logger.info("Current Player: %s", currPlayer.name)
+
+            # Update Player's dev card stack with dev cards drawn in previous turn and reset devCardPlayedThisTurn
+            currPlayer.updateDevCards()
+            currPlayer.devCardPlayedThisTurn = False
+
+            if (currPlayer.isAI):
+                self.play_ai_turn(currPlayer)
+            else:
+                self.play_human_turn(currPlayer)
+
+            self.emit('TURN_END', currPlayer)
+
+            # Check if game is over
+            if currPlayer.victoryPoints >= self.maxPoints:
+                self.gameOver = True
+                self.winner = currPlayer
+                logger.info("====================================================")
+                logger.info("PLAYER %s WINS!", currPlayer.name)
+                self.emit('GAME_OVER', currPlayer)
+                break
+
+            # Pass the turn to the next seat
+            self.currentTurn = (self.currentTurn + 1) % self.numPlayers
+
+        return self.winner
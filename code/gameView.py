@@ -1,18 +1,23 @@
 #Settlers of Catan
 #Game view class implementation with pygame
 
-import pygame
 from hexTile import *
 from hexLib import *
 
-pygame.init()
+#pygame is only imported and initialised once a view is created, so the game rules can run without a display
+pygame = None
 
 #Class to handle catan board display
 class catanGameView():
     'Class definition for Catan board display'
-    def __init__(self, catanBoardObject, catanGameObject):
+    def __init__(self, catanBoardObject, catanGameObject, pace=False):
+        global pygame
+        import pygame
+        pygame.init()
+
         self.board = catanBoardObject
         self.game = catanGameObject
+        self.pace = pace #Slow AI moves down so spectators can follow them, off for fast games
 
         # #Use pygame to display the board
         self.screen = pygame.display.set_mode(self.board.size)
@@ -33,6 +38,17 @@ class catanGameView():
         return None
 
 
+    #Function to pause between AI moves when pacing is on
+    def pause(self, seconds):
+        if(self.pace):
+            pygame.time.wait(int(seconds * 1000))
+
+    #Function to wait for the next player actions/in-game events
+    #Blocks until an event arrives instead of polling, so waiting for a click does not spin a core
+    def waitEvents(self):
+        return [pygame.event.wait()] + pygame.event.get()
+
+
     #Function to display the initial board
     def displayInitialBoard(self):
         #Dictionary to store RGB Color values
@@ -64,10 +80,11 @@ class catanGameView():
 
 
         #Display the Ports - update images/formatting later
-        for vCoord, vertexInfo in self.board.boardGraph.items():
-            if(vertexInfo.port != False):
-                portText = self.font_ports.render(vertexInfo.port, False, (0,0,0))
-                #print("Displaying {} port with coordinates x ={} and y={}".format(vertexInfo.port, vCoord.x, vCoord.y))
+        for vIndex, port in enumerate(self.board.vertexPort):
+            if(port != False):
+                vCoord = self.board.topology.vertexPixels[vIndex]
+                portText = self.font_ports.render(port, False, (0,0,0))
+                #print("Displaying {} port with coordinates x ={} and y={}".format(port, vCoord.x, vCoord.y))
 
                 if(vCoord.x < 430 and vCoord.y > 130):
                     self.screen.blit(portText, (vCoord.x-50, vCoord.y))
@@ -83,36 +100,44 @@ class catanGameView():
         return None
 
 
-    #Function to draw a road on the board
+    #Function to draw a road on the board - edgeToDraw is an edge index
     def draw_road(self, edgeToDraw, roadColor):
-        pygame.draw.line(self.screen, pygame.Color(roadColor), edgeToDraw[0], edgeToDraw[1], 10)
+        v1, v2 = self.board.topology.edgeVertexList[edgeToDraw]
+        vertexPixels = self.board.topology.vertexPixels
+        pygame.draw.line(self.screen, pygame.Color(roadColor), vertexPixels[v1], vertexPixels[v2], 10)
 
 
     #Function to draw a potential road on the board - thin
     def draw_possible_road(self, edgeToDraw, roadColor):
-        roadRect = pygame.draw.line(self.screen, pygame.Color(roadColor), edgeToDraw[0], edgeToDraw[1], 5)
+        v1, v2 = self.board.topology.edgeVertexList[edgeToDraw]
+        vertexPixels = self.board.topology.vertexPixels
+        roadRect = pygame.draw.line(self.screen, pygame.Color(roadColor), vertexPixels[v1], vertexPixels[v2], 5)
         return roadRect
 
 
-    #Function to draw a settlement on the board at vertexToDraw
+    #Function to draw a settlement on the board at vertex index vertexToDraw
     def draw_settlement(self, vertexToDraw, color):
+        vertexToDraw = self.board.topology.vertexPixels[vertexToDraw]
         newSettlement = pygame.Rect(vertexToDraw.x-10, vertexToDraw.y-10, 25, 25)
         pygame.draw.rect(self.screen, pygame.Color(color), newSettlement)
 
    
     #Function to draw a potential settlement on the board - thin
     def draw_possible_settlement(self, vertexToDraw, color):
+        vertexToDraw = self.board.topology.vertexPixels[vertexToDraw]
         possibleSettlement = pygame.draw.circle(self.screen, pygame.Color(color), (int(vertexToDraw.x), int(vertexToDraw.y)), 20, 3)
         return possibleSettlement
 
     
     #Function to draw a settlement on the board at vertexToDraw
     def draw_city(self, vertexToDraw, color):
+        vertexToDraw = self.board.topology.vertexPixels[vertexToDraw]
         pygame.draw.circle(self.screen, pygame.Color(color), (int(vertexToDraw.x), int(vertexToDraw.y)), 24)
 
    
     #Function to draw a potential settlement on the board - thin
     def draw_possible_city(self, vertexToDraw, color):
+        vertexToDraw = self.board.topology.vertexPixels[vertexToDraw]
         possibleCity = pygame.draw.circle(self.screen, pygame.Color(color), (int(vertexToDraw.x), int(vertexToDraw.y)), 25, 5)
         return possibleCity
 
@@ -124,6 +149,7 @@ class catanGameView():
 
     #Function to draw possible players to rob
     def draw_possible_players_to_rob(self, vertexCoord):
+        vertexCoord = self.board.topology.vertexPixels[vertexCoord]
         possiblePlayer = pygame.draw.circle(self.screen, pygame.Color('black'), (int(vertexCoord.x), int(vertexCoord.y)), 35, 5)
         return possiblePlayer
         
@@ -183,9 +209,7 @@ class catanGameView():
         #Robber text
         robberText = self.font_Robber.render("R", False, (0,0,0))
         #Get the coordinates for the robber
-        for hexTile in self.board.hexTileDict.values():
-            if(hexTile.robber):
-                robberCoords = hexTile.pixelCenter
+        robberCoords = self.board.hexTileDict[self.board.robberHex].pixelCenter
 
         self.screen.blit(robberText, (int(robberCoords.x) -20, int(robberCoords.y)-35)) 
 
@@ -200,7 +224,7 @@ class catanGameView():
         self.displayRobber()
 
         #Loop through and display all existing buildings from players build graphs
-        for player_i in list(self.game.playerQueue.queue): #Build Settlements and roads of each player
+        for player_i in self.game.players: #Build Settlements and roads of each player
             for existingRoad in player_i.buildGraph['ROADS']:
                 self.draw_road(existingRoad, player_i.color)
             
@@ -242,23 +266,23 @@ class catanGameView():
         mouseClicked = False #Get player actions until a mouse is clicked
         while(mouseClicked == False):
             if(self.game.gameSetup):#during gameSetup phase only exit if road is built
-                for e in pygame.event.get(): 
+                for e in self.waitEvents(): 
                     if e.type == pygame.QUIT:
                             sys.exit(0)
                     if(e.type == pygame.MOUSEBUTTONDOWN):
                         for road, roadRect in roadsPossibleDict.items():
                             if(roadRect.collidepoint(e.pos)): 
-                                #currentPlayer.build_road(road[0], road[1], self.board)
+                                #currentPlayer.build_road(road, self.board)
                                 mouseClicked = True
                                 return road
 
 
             else: 
-                for e in pygame.event.get(): 
+                for e in self.waitEvents(): 
                     if(e.type == pygame.MOUSEBUTTONDOWN): #Exit this loop on mouseclick
                         for road, roadRect in roadsPossibleDict.items():
                             if(roadRect.collidepoint(e.pos)): 
-                                #currentPlayer.build_road(road[0], road[1], self.board)
+                                #currentPlayer.build_road(road, self.board)
                                 return road
 
                         mouseClicked = True
@@ -282,7 +306,7 @@ class catanGameView():
 
         while(mouseClicked == False):
             if(self.game.gameSetup): #during gameSetup phase only exit if settlement is built
-                for e in pygame.event.get(): 
+                for e in self.waitEvents(): 
                     if e.type == pygame.QUIT:
                             sys.exit(0)
                     if(e.type == pygame.MOUSEBUTTONDOWN):
@@ -292,7 +316,7 @@ class catanGameView():
                                 mouseClicked = True
                                 return vertex
             else:
-                for e in pygame.event.get(): 
+                for e in self.waitEvents(): 
                     if(e.type == pygame.MOUSEBUTTONDOWN): #Exit this loop on mouseclick
                         for vertex, vertexRect in verticesPossibleDict.items():
                             if(vertexRect.collidepoint(e.pos)): 
@@ -319,7 +343,7 @@ class catanGameView():
         mouseClicked = False #Get player actions until a mouse is clicked - whether a city is built or not
 
         while(mouseClicked == False):
-            for e in pygame.event.get(): 
+            for e in self.waitEvents(): 
                 if(e.type == pygame.MOUSEBUTTONDOWN): #Exit this loop on mouseclick
                     for vertex, vertexRect in verticesPossibleDict.items():
                         if(vertexRect.collidepoint(e.pos)): 
@@ -334,15 +358,14 @@ class catanGameView():
     def moveRobber_display(self, currentPlayer, possibleRobberDict):
         #Get all spots the player can move robber to and show circles
         #Add in the Rect representations of possible robber spots
-        for R in possibleRobberDict.keys():
-            possibleRobberDict[R] = self.draw_possible_robber(possibleRobberDict[R].pixelCenter)
+        possibleRobberDict = {R: self.draw_possible_robber(hexTile.pixelCenter) for R, hexTile in possibleRobberDict.items()}
 
         pygame.display.update()
 
         mouseClicked = False #Get player actions until a mouse is clicked - whether a road is built or not
 
         while(mouseClicked == False):
-            for e in pygame.event.get(): 
+            for e in self.waitEvents(): 
                 if(e.type == pygame.MOUSEBUTTONDOWN): #Exit this loop on mouseclick
                     for hexIndex, robberCircleRect in possibleRobberDict.items():
                         if(robberCircleRect.collidepoint(e.pos)): 
@@ -372,7 +395,7 @@ class catanGameView():
 
         mouseClicked = False #Get player actions until a mouse is clicked - whether a road is built or not
         while(mouseClicked == False):
-            for e in pygame.event.get(): 
+            for e in self.waitEvents(): 
                 if(e.type == pygame.MOUSEBUTTONDOWN): #Exit this loop on mouseclick
                     for playerToRob, playerCircleRect in possiblePlayerDict.items():
                         if(playerCircleRect.collidepoint(e.pos)): 
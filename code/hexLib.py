@@ -120,6 +120,13 @@ def hex_corner_offset(layout, corner):
     angle = 2.0 * math.pi * (M.start_angle - corner) / 6.0
     return Point(size.x * math.cos(angle), size.y * math.sin(angle))
 
+#Get a key for corner i of hex h (flat layout) that is the same for all 3 hexes sharing that corner
+#Corner i lies between the neighbors in directions i and i+1, so the key is the sorted triple of those hexes
+def hex_corner_key(h, corner):
+    n1 = hex_neighbor(h, corner)
+    n2 = hex_neighbor(h, (corner + 1) % 6)
+    return tuple(sorted([(h.q, h.r), (n1.q, n1.r), (n2.q, n2.r)]))
+
 #Get the corners of the Polygon in pixel coordinates
 def polygon_corners(layout, h):
     corners = []
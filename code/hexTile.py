@@ -1,5 +1,5 @@
 #Settlers of Catan
-#Vertex and Hextile class implementation
+#Hextile class implementation
 
 import collections
 from hexLib import *
@@ -42,37 +42,6 @@ class hexTile():
         return None
 
 
-#Class definition of a Vertex
-class Vertex():
-    
-    def __init__(self, pixelCoord, adjHexIndex, vIndex):
-        self.vertexIndex = vIndex #Index to store vertex info
-        self.pixelCoordinates = pixelCoord
-        self.edgeList = [] #List to store adjacent Vertices
-        self.adjacentHexList = [adjHexIndex] #List to store indices of 3 adjacent hexes
-        self.edgeState = [[None, False], [None, False], [None, False]] #Nested list to determine if a road is built on edge, and player building road
-
-        self.state = {'Player': None, 'Settlement':False, 'City':False} #Vertex state 
-        self.port = False #Add the corresponding port (BRICK, SHEEP, WHEAT, WOOD, ORE, 3:1) later
-        self.isColonised = False
-
-        self.edgeLength = 80 #Specify for hex size
-
-    #Function to get a Vertex by its pixel coordinates
-    def getVertex_fromPixel(self, coords):
-        if(self.pixelCoordinates == coords):
-            return self
-
-    #Function to return if a vertex v1 is adjacent to another v2
-    def isAdjacent(self, v1, v2):
-        dist = ((v1.pixelCoordinates.x - v2.pixelCoordinates.x)**2 + (v1.pixelCoordinates.y - v2.pixelCoordinates.y)**2)**0.5
-        if(round(dist) == self.edgeLength):
-            return True
-
-        return False
-
-
-
 #Test Code
 # testHex = hexTile(0, Resource('Ore', 8), Point(2,3), [hexTile(2, Resource('Wheat', 11), Point(5,6)), hexTile(3, Resource('Brick', 11), Point(7,4))])
 # testHex.displayHexInfo()
@@ -2,7 +2,13 @@
 # Player class implementation
 
 from board import *
+from zobristHash import *
 import numpy as np
+import logging
+
+# Game events are logged at INFO and AI reasoning at DEBUG, on loggers under 'catan'
+# Nothing is formatted or written unless logging is configured for that level, like in catanGame or catan.py
+logger = logging.getLogger('catan.player')
 
 # Class definition for a player
 
@@ -11,9 +17,11 @@ class player():
     'Class Definition for Game Player'
 
     # Initialize a game player, we use A, B and C to identify
-    def __init__(self, playerName, playerColor, max_points):
+    # seat is the player's position in the game, used to give each player its own hash keys
+    def __init__(self, playerName, playerColor, max_points, seat=0):
         self.name = playerName
         self.color = playerColor
+        self.seat = seat
         self.victoryPoints = 0
         self.isAI = False
 
@@ -39,8 +47,9 @@ class player():
         self.portList = []  # List of ports acquired
 
         # Dev cards in possession
-        # List to keep the new dev cards draw - update the main list every turn
-        self.newDevCards = []
+        # Counts of the new dev cards drawn - moved to the main counts every turn
+        self.newDevCards = {'KNIGHT': 0, 'VP': 0, 'MONOPOLY': 0,
+                            'ROADBUILDER': 0, 'YEAROFPLENTY': 0}
         self.devCards = {'KNIGHT': 0, 'VP': 0, 'MONOPOLY': 0,
                          'ROADBUILDER': 0, 'YEAROFPLENTY': 0}
         self.devCardPlayedThisTurn = False
@@ -50,16 +59,42 @@ class player():
         # NOTE: Dylan added max_points field so players are aware of how much they need to win
         self.max_points = max_points
 
-    # function to build a road from vertex v1 to vertex v2
+    # Resources and dev cards are kept as hashed hands, so the game position hash follows every change
+    @property
+    def resources(self):
+        return self._resources
+
+    @resources.setter
+    def resources(self, counts):
+        self._resources = handDict(counts, cardKeys[self.seat])
+
+    @property
+    def devCards(self):
+        return self._devCards
+
+    @devCards.setter
+    def devCards(self, counts):
+        self._devCards = handDict(counts, cardKeys[self.seat])
+
+    # Cards bought this turn hash with their own keys, as they can't be played until the next turn
+    @property
+    def newDevCards(self):
+        return self._newDevCards
+
+    @newDevCards.setter
+    def newDevCards(self, counts):
+        self._newDevCards = handDict(counts, newCardKeys[self.seat])
+
+    # function to build a road on the edge with index edge
 
     # DYLAN: added roadbuilder flag to not charge for materials
-    def build_road(self, v1, v2, board, road_builder=False):
-        'Update buildGraph to add a road on edge v1 - v2'
+    def build_road(self, edge, board, road_builder=False):
+        'Update buildGraph to add a road on edge'
 
         # Check if player has resources available
         if (self.resources['BRICK'] > 0 and self.resources['WOOD'] > 0) or road_builder:
             if (self.roadsLeft > 0):  # Check if player has roads left
-                self.buildGraph['ROADS'].append((v1, v2))
+                self.buildGraph['ROADS'].append(edge)
                 self.roadsLeft -= 1
 
                 if not road_builder:
@@ -68,24 +103,24 @@ class player():
                     self.resources['WOOD'] -= 1
 
                 # update the overall boardGraph
-                board.updateBoardGraph_road(v1, v2, self)
+                board.updateBoardGraph_road(edge, self)
 
                 # Calculate current max road length and update
                 maxRoads = self.get_road_length(board)
                 self.maxRoadLength = maxRoads
 
-                print('{} Built a Road. MaxRoadLength: {}'.format(
-                    self.name, self.maxRoadLength))
+                logger.info('%s Built a Road. MaxRoadLength: %s',
+                    self.name, self.maxRoadLength)
 
             else:
-                print("No roads available to build")
+                logger.info("No roads available to build")
 
         else:
-            print("Insufficient Resources to Build Road - Need 1 BRICK, 1 WOOD")
+            logger.info("Insufficient Resources to Build Road - Need 1 BRICK, 1 WOOD")
 
-    # function to build a settlement on vertex with coordinates vCoord
+    # function to build a settlement on vertex with index vIndex
 
-    def build_settlement(self, vCoord, board):
+    def build_settlement(self, vIndex, board):
         'Update player buildGraph and boardgraph to add a settlement on vertex v'
         # Take input from Player on where to build settlement
         # Check if player has correct resources
@@ -94,7 +129,7 @@ class player():
         # Check if player has resources available
         if (self.resources['BRICK'] > 0 and self.resources['WOOD'] > 0 and self.resources['SHEEP'] > 0 and self.resources['WHEAT'] > 0):
             if (self.settlementsLeft > 0):  # Check if player has settlements left
-                self.buildGraph['SETTLEMENTS'].append(vCoord)
+                self.buildGraph['SETTLEMENTS'].append(vIndex)
                 self.settlementsLeft -= 1
 
                 # Update player resources
@@ -106,52 +141,58 @@ class player():
                 self.victoryPoints += 1
                 self.visibleVictoryPoints += 1
                 # update the overall boardGraph
-                board.updateBoardGraph_settlement(vCoord, self)
+                board.updateBoardGraph_settlement(vIndex, self)
+
+                # A settlement cuts opponent roads running through this vertex - only their road length can change
+                roadOwners = [board.edgeOwner[edge] for edge in board.topology.vertexEdgeList[vIndex]]
+                for roadOwner in set(roadOwners) - {None, self}:
+                    if (roadOwners.count(roadOwner) >= 2):
+                        roadOwner.maxRoadLength = roadOwner.get_road_length(board)
 
                 # print('{} Built a Settlement'.format(self.name))
 
                 # DYLAN: Adjusted the print statement for when a settlement is built to make the console more readable
-                adj_resources = []
-                adj_nums = []
-
-                for adjacentHex in board.boardGraph[vCoord].adjacentHexList:
-                    if (board.hexTileDict[adjacentHex].resource.type != 'DESERT'):
-                        adj_nums.append(
-                            str(board.hexTileDict[adjacentHex].resource.num))
-                    else:
+                if logger.isEnabledFor(logging.INFO):
+                    adj_resources = []
+                    adj_nums = []
+
+                    for adjacentHex in board.topology.vertexHexList[vIndex]:
+                        if (board.hexTileDict[adjacentHex].resource.type != 'DESERT'):
+                            adj_nums.append(
+                                str(board.hexTileDict[adjacentHex].resource.num))
+                        else:
+                            adj_nums.append("0")
+                        adj_resources.append(
+                            board.hexTileDict[adjacentHex].resource.type)
+
+                    for i in range(3):
+                        if len(adj_resources) == 3:
+                            break
+                        adj_resources.append("Nothing")
                         adj_nums.append("0")
-                    adj_resources.append(
-                        board.hexTileDict[adjacentHex].resource.type)
 
-                for i in range(3):
-                    if len(adj_resources) == 3:
-                        break
-                    adj_resources.append("Nothing")
-                    adj_nums.append("0")
-
-                print('{} Built a Settlement at the {}, {}, {}, {}-{}-{}'.format(self.name,
-                      adj_nums[0], adj_nums[1], adj_nums[2], adj_resources[0], adj_resources[1], adj_resources[2]))
+                    logger.info('%s Built a Settlement at the %s, %s, %s, %s-%s-%s', self.name,
+                                adj_nums[0], adj_nums[1], adj_nums[2], adj_resources[0], adj_resources[1], adj_resources[2])
 
                 # Add port to players port list if it is a new port
-                if ((board.boardGraph[vCoord].port != False) and (board.boardGraph[vCoord].port not in self.portList)):
-                    self.portList.append(board.boardGraph[vCoord].port)
-                    print("{} now has {} Port access".format(
-                        self.name, board.boardGraph[vCoord].port))
+                if ((board.vertexPort[vIndex] != False) and (board.vertexPort[vIndex] not in self.portList)):
+                    self.portList.append(board.vertexPort[vIndex])
+                    logger.info("%s now has %s Port access",
+                        self.name, board.vertexPort[vIndex])
 
             else:
-                print("No settlements available to build")
+                logger.info("No settlements available to build")
 
         else:
-            print(
-                "Insufficient Resources to Build Settlement. Build Cost: 1 BRICK, 1 WOOD, 1 WHEAT, 1 SHEEP")
+            logger.info("Insufficient Resources to Build Settlement. Build Cost: 1 BRICK, 1 WOOD, 1 WHEAT, 1 SHEEP")
 
     # function to build a city on vertex v
-    def build_city(self, vCoord, board):
+    def build_city(self, vIndex, board):
         'Upgrade existing settlement to city in buildGraph'
         # Check if player has resources available
         if (self.resources['WHEAT'] >= 2 and self.resources['ORE'] >= 3):
             if (self.citiesLeft > 0):
-                self.buildGraph['CITIES'].append(vCoord)
+                self.buildGraph['CITIES'].append(vIndex)
                 # Increase number of settlements and decrease number of cities
                 self.settlementsLeft += 1
                 self.citiesLeft -= 1
@@ -163,14 +204,14 @@ class player():
                 self.visibleVictoryPoints += 1
 
                 # update the overall boardGraph
-                board.updateBoardGraph_city(vCoord, self)
-                print('{} Built a City'.format(self.name))
+                board.updateBoardGraph_city(vIndex, self)
+                logger.info('%s Built a City', self.name)
 
             else:
-                print("No cities available to build")
+                logger.info("No cities available to build")
 
         else:
-            print("Insufficient Resources to Build City. Build Cost: 3 ORE, 2 WHEAT")
+            logger.info("Insufficient Resources to Build City. Build Cost: 3 ORE, 2 WHEAT")
 
     # function to move robber to a specific hex and steal from a player
     def move_robber(self, hexIndex, board, player_robbed):
@@ -178,15 +219,15 @@ class player():
         board.updateBoardGraph_robber(hexIndex)
 
         # Steal a random resource from other players
-        self.steal_resource(player_robbed)
+        self.steal_resource(player_robbed, board)
 
         return
 
     # Function to steal a random resource from player_2
 
-    def steal_resource(self, player_2):
+    def steal_resource(self, player_2, board):
         if (player_2 == None):
-            print("No Player on this hex to Rob")
+            logger.info("No Player on this hex to Rob")
             return
 
         # Get all resources player 2 has in a list and use random list index to steal
@@ -196,111 +237,41 @@ class player():
 
         # DYLAN: Code breaks if trying to steal from a player with 0 resources.
         if len(p2_resources) == 0:
-            print("Player {} had no resources, so nothing was stolen".format(
-                player_2.name))
+            logger.info("Player %s had no resources, so nothing was stolen",
+                player_2.name)
             return
 
-        resourceIndexToSteal = np.random.randint(0, len(p2_resources))
+        resourceIndexToSteal = board.rng.integers(0, len(p2_resources))
 
         # Get a random permutation and steal a card
-        p2_resources = np.random.permutation(p2_resources)
+        p2_resources = board.rng.permutation(p2_resources)
         resourceStolen = p2_resources[resourceIndexToSteal]
 
         # Update resources of both players
         player_2.resources[resourceStolen] -= 1
         self.resources[resourceStolen] += 1
-        print("Stole 1 {} from Player {}".format(
-            resourceStolen, player_2.name))
+        logger.info("Stole 1 %s from Player %s",
+            resourceStolen, player_2.name)
 
         return
 
     # Function to calculate road length for longest road calculation
-    # Use both player buildgraph and board graph to compute recursively
+    # The board searches the player's roads for the longest trail, see catanBoard.getRoadLength
 
     def get_road_length(self, board):
-        roadLengths = []  # List to store road lengths from each starting edge
-        for road in self.buildGraph['ROADS']:  # check for every starting edge
-            # List to keep track of all lengths of roads resulting from this root road
-            self.road_i_lengths = []
-            roadCount = 0
-            roadArr = []
-            vertexList = []
-            #print("Start road:", road)
-            self.check_path_length(
-                road, roadArr, roadCount, vertexList, board.boardGraph)
-
-            road_inverted = (road[1], road[0])
-            roadCount = 0
-            roadArr = []
-            vertexList = []
-            self.check_path_length(
-                road_inverted, roadArr, roadCount, vertexList, board.boardGraph)
-
-            # Update roadLength with max starting from this road
-            roadLengths.append(max(self.road_i_lengths))
-            # print(self.road_i_lengths)
-
-        #print("Road Lengths:", roadLengths, max(roadLengths))
-        return max(roadLengths)
-
-    # Function to checl the path length from a current edge to all possible other vertices not yet visited by t
-    def check_path_length(self, edge, edgeList, roadLength, vertexList, boardGraph):
-        # Append current edge to list and increment road count
-        edgeList.append(edge)  # Append the road
-        roadLength += 1
-        vertexList.append(edge[0])  # Append the first vertex
-
-        # Get new neighboring forward edges from this edge - not visited by the search yet
-        road_neighbors_list = self.get_neighboring_roads(
-            edge, boardGraph, edgeList, vertexList)
-
-        # print(neighboringRoads)
-        # if no neighboring roads exist append the roadLength upto this edge
-        if (road_neighbors_list == []):
-            #print("No new neighbors found")
-            self.road_i_lengths.append(roadLength)
-            return
+        return board.getRoadLength(self)
 
-        else:
-            # check paths from left and right neighbors separately
-            for neighbor_road in road_neighbors_list:
-                #print("checking neighboring edge:", neighbor_road)
-                self.check_path_length(
-                    neighbor_road, edgeList, roadLength, vertexList, boardGraph)
-
-    # Helper function to get neighboring edges from this road that haven't already been explored
-    # We want forward neighbors only
-
-    def get_neighboring_roads(self, road_i, boardGraph, visitedRoads, visitedVertices):
-        #print("Getting neighboring roads for current road:", road_i)
-        newNeighbors = []
-        # Use v1 and v2 to get the vertices to expand from
-        v1 = road_i[0]
-        v2 = road_i[1]
-        for edge in self.buildGraph['ROADS']:
-            if (edge[1] in visitedVertices):
-                # flip the edge if the orientation is reversed
-                edge = (edge[1], edge[0])
-
-            if (edge not in visitedRoads):  # If it is a new distinct edge
-                # Add condition for vertex to be not colonised by anyone else
-                if (boardGraph[v2].state['Player'] in [self, None]):
-                    # If v2 has neighbors, defined starting or finishing at v2
-                    if (edge[0] == v2 and edge[0] not in visitedVertices):
-                        #print("Appending NEW neighbor:", edge)
-                        newNeighbors.append(edge)
-
-                    if (edge[0] == v1 and edge[0] not in visitedVertices):
-                        newNeighbors.append(edge)
-
-                    # If v1 has neighbors, defined starting or finishing at v2
-                    if (edge[1] == v2 and edge[1] not in visitedVertices):
-                        newNeighbors.append((edge[1], edge[0]))
-
-                    if (edge[1] == v1 and edge[1] not in visitedVertices):
-                        newNeighbors.append((edge[1], edge[0]))
-
-        return newNeighbors
+    # Function to get the road length the player would have after building new roads, without building them
+    # roads is an edge index or a list of them - only the road networks they join are searched again
+    def road_length_if_added(self, board, roads):
+        if isinstance(roads, (int, np.integer)):
+            roads = [roads]
+        return board.getRoadLengthWithRoads(self, roads)
+
+    # Function to get the road length the player would have after building each of a list of road sets, without building them
+    # The sets are evaluated together so they share the work, see catanBoard.getRoadLengthsWithRoads
+    def road_lengths_if_added(self, board, road_sets):
+        return board.getRoadLengthsWithRoads(self, road_sets)
 
     # function to end turn
 
@@ -319,13 +290,13 @@ class player():
 
             # IF there are no devCards left
             if (devCardsToDraw == []):
-                print("No Dev Cards Left!")
+                logger.info("No Dev Cards Left!")
                 return
 
-            devCardIndex = np.random.randint(0, len(devCardsToDraw))
+            devCardIndex = board.rng.integers(0, len(devCardsToDraw))
 
             # Get a random permutation and draw a card
-            devCardsToDraw = np.random.permutation(devCardsToDraw)
+            devCardsToDraw = board.rng.permutation(devCardsToDraw)
             cardDrawn = devCardsToDraw[devCardIndex]
 
             # Update player resources
@@ -342,23 +313,22 @@ class player():
                     self.devCards['VP']
 
             else:  # Update player dev card and the stack
-                self.newDevCards.append(cardDrawn)
+                self.newDevCards[cardDrawn] += 1
                 board.devCardStack[cardDrawn] -= 1
 
             if show_card:
-                print("{} drew a {} from Development Card Stack".format(
-                    self.name, cardDrawn))
+                logger.info("%s drew a %s from Development Card Stack",
+                    self.name, cardDrawn)
 
         else:
-            print("Insufficient Resources for Dev Card. Cost: 1 ORE, 1 WHEAT, 1 SHEEP")
+            logger.info("Insufficient Resources for Dev Card. Cost: 1 ORE, 1 WHEAT, 1 SHEEP")
 
     # Function to update dev card stack with dev cards drawn from prior turn
     def updateDevCards(self):
-        for newCard in self.newDevCards:
-            self.devCards[newCard] += 1
-
-        # Reset the new card list to blank
-        self.newDevCards = []
+        for newCard, newAmount in self.newDevCards.items():
+            if newAmount:
+                self.devCards[newCard] += newAmount
+                self.newDevCards[newCard] = 0
 
     # function to play a development card
     def play_devCard(self, game):
@@ -434,11 +404,10 @@ class player():
                     "Enter resource name to monopolise: ").upper()
 
             # Loop over each player to Monopolize all resources
-            for player in list(game.playerQueue.queue):
-                if (player != self):
-                    numLost = player.resources[resourceToMonopolize]
-                    player.resources[resourceToMonopolize] = 0
-                    self.resources[resourceToMonopolize] += numLost
+            for player in game.opponents[self.seat]:
+                numLost = player.resources[resourceToMonopolize]
+                player.resources[resourceToMonopolize] = 0
+                self.resources[resourceToMonopolize] += numLost
 
         return
 
@@ -456,25 +425,25 @@ class player():
         if (r1_port in self.portList and self.resources[r1] >= 2):
             self.resources[r1] -= 2
             self.resources[r2] += 1
-            print("Traded 2 {} for 1 {} using {} Port".format(r1, r2, r1))
+            logger.info("Traded 2 %s for 1 %s using %s Port", r1, r2, r1)
             return
 
         # Check for 3:1 Port
         elif ('3:1 PORT' in self.portList and self.resources[r1] >= 3):
             self.resources[r1] -= 3
             self.resources[r2] += 1
-            print("Traded 3 {} for 1 {} using 3:1 Port".format(r1, r2))
+            logger.info("Traded 3 %s for 1 %s using 3:1 Port", r1, r2)
             return
 
         # Check 4:1 port
         elif (self.resources[r1] >= 4):
             self.resources[r1] -= 4
             self.resources[r2] += 1
-            print("Traded 4 {} for 1 {}".format(r1, r2))
+            logger.info("Traded 4 %s for 1 %s", r1, r2)
             return
 
         else:
-            print("Insufficient resource {} to trade with Bank".format(r1))
+            logger.info("Insufficient resource %s to trade with Bank", r1)
             return
 
     # Function to initate a trade - with bank or other players
@@ -581,28 +550,26 @@ class player():
             requesting[resourceToReceive] = resource_received_amount
 
             # offer to all players
-            for playerToTrade in list(game.playerQueue.queue):
-                # who arent ourselves
-                if playerToTrade != self:
+            for playerToTrade in game.opponents[self.seat]:
 
-                    # if accepted, make the trade and return
-                    if playerToTrade.accept_or_decline_trade(board, offering, requesting):
+                # if accepted, make the trade and return
+                if playerToTrade.accept_or_decline_trade(board, offering, requesting):
 
-                        # Execute trade - player gives resource traded and gains resource received
-                        self.resources[resourceToReceive] += resource_received_amount
-                        self.resources[resourceToTrade] -= resource_traded_amount
+                    # Execute trade - player gives resource traded and gains resource received
+                    self.resources[resourceToReceive] += resource_received_amount
+                    self.resources[resourceToTrade] -= resource_traded_amount
 
-                        # Other player gains resource traded and gives resource received
-                        playerToTrade.resources[resourceToReceive] -= resource_received_amount
-                        playerToTrade.resources[resourceToTrade] += resource_traded_amount
+                    # Other player gains resource traded and gives resource received
+                    playerToTrade.resources[resourceToReceive] -= resource_received_amount
+                    playerToTrade.resources[resourceToTrade] += resource_traded_amount
 
-                        print("Player {} successfully traded {} {} for {} {} with player {}".format(self.name, resource_traded_amount, resourceToTrade,
-                                                                                                    resource_received_amount, resourceToReceive, playerToTrade.name))
-                        return
-                    else:
-                        print("{} rejected trade for {} {} for {} {} with player {}".format(playerToTrade.name, resource_traded_amount, resourceToTrade,
-                                                                                            resource_received_amount, resourceToReceive, self.name))
-                        continue
+                    logger.info("Player %s successfully traded %s %s for %s %s with player %s", self.name, resource_traded_amount, resourceToTrade,
+                                resource_received_amount, resourceToReceive, playerToTrade.name)
+                    return
+                else:
+                    logger.info("%s rejected trade for %s %s for %s %s with player %s", playerToTrade.name, resource_traded_amount, resourceToTrade,
+                                resource_received_amount, resourceToReceive, self.name)
+                    continue
 
             return
 
@@ -655,23 +622,23 @@ class player():
         if not true_vp:
             vp_to_show = self.visibleVictoryPoints
 
-        print("Player:{}, Points: {}".format(
-            self.name, vp_to_show))
+        logger.info("Player:%s, Points: %s",
+            self.name, vp_to_show)
 
         if resources:
-            print("- Resources:{}".format(self.resources))
+            logger.info("- Resources:%s", self.resources)
         else: 
-            print("- Resources:{}".format(sum(self.resources.values())))
+            logger.info("- Resources:%s", sum(self.resources.values()))
 
         if dev_cards:
-            print('- Available Dev Cards: {}'.format(self.devCards))
+            logger.info('- Available Dev Cards: %s', self.devCards)
         else:
-            print('- Dev Cards: {}'.format(sum(self.devCards.values())))
+            logger.info('- Dev Cards: %s', sum(self.devCards.values()))
 
         if buildings_left:
-            print("- RoadsLeft:{}, SettlementsLeft:{}, CitiesLeft:{}".format(
-                self.roadsLeft, self.settlementsLeft, self.citiesLeft))
+            logger.info("- RoadsLeft:%s, SettlementsLeft:%s, CitiesLeft:%s",
+                self.roadsLeft, self.settlementsLeft, self.citiesLeft)
 
         if road_and_army_info:
-            print('- MaxRoadLength:{}, LongestRoad:{}, KnightsPlayed:{}, LargestArmy:{}\n'.format(
-                self.maxRoadLength, self.longestRoadFlag, self.knightsPlayed, self.largestArmyFlag))
+            logger.info('- MaxRoadLength:%s, LongestRoad:%s, KnightsPlayed:%s, LargestArmy:%s\n',
+                self.maxRoadLength, self.longestRoadFlag, self.knightsPlayed, self.largestArmyFlag)
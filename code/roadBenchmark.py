@@ -0,0 +1,332 @@
+# Settlers of Catan
+# Longest road corpus, benchmark and differential checker
+#
+# Longest road is the most fragile hot path of the game - it is a search, it has the rule that another player's
+# settlement cuts a road, and the AI asks for it for every road it considers. This module keeps:
+#   - a corpus of adversarial road networks (loops, forks, figure eights, cut networks, full 15 road networks)
+#     plus seeded random networks
+#   - reference implementations - a brute force trail search, and the recursion the game used before
+#     catanBoard.getRoadLength (legacy_road_length), kept as it was
+#   - check_corpus, which checks that the board's search, its cache, and the incremental and batched queries
+#     agree with the brute force search on every network, and with the expected length of the hand made ones
+#   - benchmark, which times every implementation on the corpus
+#
+# Run it with python -m catan roads, see catan.py
+
+from board import *
+from player import player
+import random
+import time
+
+# Centre hex of the standard board, so every network in the corpus has room around it
+center_hex = 0
+
+
+# Function to get the roads around a hex
+def hex_roads(topology, hexIndex):
+    corners = topology.hexVertexList[hexIndex]
+    return [topology.getEdge(corners[i], corners[(i + 1) % 6]) for i in range(6)]
+
+
+# Function to get the roads along a path of vertices
+def path_roads(topology, vertices):
+    return [topology.getEdge(v1, v2) for v1, v2 in zip(vertices, vertices[1:])]
+
+
+# Function to get a path of numVertices vertices from start that doesn't go through any vertex of avoid
+# Always takes the lowest free neighbor, so a case is the same on every run
+def outward_path(topology, start, numVertices, avoid=()):
+    path = [start]
+    visited = set(avoid) | {start}
+    while len(path) < numVertices:
+        nextVertices = [v for v in topology.vertexNeighborList[path[-1]] if v not in visited]
+        if not nextVertices:
+            raise ValueError("No path of {} vertices from vertex {}".format(numVertices, start))
+        path.append(nextVertices[0])
+        visited.add(nextVertices[0])
+    return path
+
+
+# Function to get the hand made corpus, as a list of dicts with
+#   name, roads (edge indices), settlements (vertices of the player), cuts (vertices of another player's settlements)
+#   and length, the expected longest road worked out by hand
+def adversarial_cases(topology=standardTopology):
+    ring = topology.hexVertexList[center_hex]
+    neighborHex = topology.hexNeighborList[center_hex][0]
+    thirdHex = [h for h in topology.hexNeighborList[center_hex] if h in topology.hexNeighborList[neighborHex]][0]
+    twoHexes = sorted(set(hex_roads(topology, center_hex)) | set(hex_roads(topology, neighborHex)))
+    threeHexes = sorted(set(twoHexes) | set(hex_roads(topology, thirdHex)))
+    twoHexVertices = set(topology.hexVertexList[center_hex]) | set(topology.hexVertexList[neighborHex])
+
+    # A corner of the two hexes that is on just one of them, with a tail leading away from both
+    freeCorner = [v for v in topology.hexVertexList[neighborHex] if v not in ring and
+                  any(n not in twoHexVertices for n in topology.vertexNeighborList[v])][0]
+    tail4 = outward_path(topology, freeCorner, 5, twoHexVertices)
+    loopTail = outward_path(topology, ring[0], 3, ring)
+
+    # Three arms of 3, 2 and 1 roads out of ring[0]
+    arms = [outward_path(topology, ring[0], 4, ring[2:])]
+    arms.append(outward_path(topology, ring[0], 3, set(arms[0]) | set(ring[2:]) - {ring[0]}))
+    arms.append(outward_path(topology, ring[0], 2, set(arms[0]) | set(arms[1]) - {ring[0]}))
+    forkRoads = [road for arm in arms for road in path_roads(topology, arm)]
+
+    line = list(ring[:6])  # 5 roads around the centre hex
+    farStart = [v for v in topology.hexVertexList[thirdHex] if v not in ring][0]
+    farPath = outward_path(topology, farStart, 4, ring)
+
+    return [
+        {'name': 'single road', 'roads': path_roads(topology, line[:2]), 'settlements': [], 'cuts': [], 'length': 1},
+        {'name': 'line', 'roads': path_roads(topology, line), 'settlements': [], 'cuts': [], 'length': 5},
+        {'name': 'loop', 'roads': hex_roads(topology, center_hex), 'settlements': [], 'cuts': [], 'length': 6},
+        {'name': 'loop with tail', 'roads': hex_roads(topology, center_hex) + path_roads(topology, loopTail),
+         'settlements': [], 'cuts': [], 'length': 8},
+        {'name': 'fork 3-2-1', 'roads': forkRoads, 'settlements': [], 'cuts': [], 'length': 5},
+        {'name': 'figure eight', 'roads': twoHexes, 'settlements': [], 'cuts': [], 'length': 11},
+        {'name': 'figure eight with tail (15 roads)', 'roads': twoHexes + path_roads(topology, tail4),
+         'settlements': [], 'cuts': [], 'length': 14},
+        {'name': 'three hexes (15 roads)', 'roads': threeHexes, 'settlements': [], 'cuts': [], 'length': 14},
+        {'name': 'two networks', 'roads': path_roads(topology, line[:5]) + path_roads(topology, farPath),
+         'settlements': [], 'cuts': [], 'length': 4},
+        {'name': 'line cut in the middle', 'roads': path_roads(topology, line), 'settlements': [], 'cuts': [line[2]], 'length': 3},
+        {'name': 'line with own settlement', 'roads': path_roads(topology, line), 'settlements': [line[2]], 'cuts': [], 'length': 5},
+        {'name': 'loop cut once', 'roads': hex_roads(topology, center_hex), 'settlements': [], 'cuts': [ring[0]], 'length': 6},
+        {'name': 'loop cut twice', 'roads': hex_roads(topology, center_hex), 'settlements': [], 'cuts': [ring[0], ring[2]], 'length': 4},
+        {'name': 'loop with tail cut at the fork', 'roads': hex_roads(topology, center_hex) + path_roads(topology, loopTail),
+         'settlements': [], 'cuts': [ring[0]], 'length': 6},
+        {'name': 'fork cut at the fork', 'roads': forkRoads, 'settlements': [], 'cuts': [ring[0]], 'length': 3},
+        {'name': 'figure eight cut at a fork', 'roads': twoHexes, 'settlements': [],
+         'cuts': [[v for v in ring if v in topology.hexVertexList[neighborHex]][0]], 'length': 10},
+    ]
+
+
+# Function to get n seeded random networks of 1 to 15 roads, grown from one vertex, some of them cut by other players
+# Their expected length is left to the brute force search (length None)
+def random_cases(n, seed=0, topology=standardTopology):
+    rng = random.Random(seed)
+    cases = []
+    for i in range(n):
+        vertices = {rng.randrange(topology.numVertices)}
+        roads = []
+        for j in range(rng.randint(1, 15)):
+            freeRoads = sorted({e for v in vertices for e in topology.vertexEdgeList[v]} - set(roads))
+            road = rng.choice(freeRoads)
+            roads.append(road)
+            vertices.update(topology.edgeVertexList[road])
+
+        cuts = rng.sample(sorted(vertices), rng.randint(0, min(2, len(vertices))))
+        cases.append({'name': 'random {}'.format(i), 'roads': roads, 'settlements': [], 'cuts': cuts, 'length': None})
+    return cases
+
+
+# Function to set up the board of a case - returns (board, player, opponent)
+def build_case(case):
+    board = catanBoard(seed=0)
+    player_i = player('Player', 'black', 10, seat=0)
+    opponent = player('Opponent', 'darkslateblue', 10, seat=1)
+
+    for vertex in case['settlements']:
+        player_i.buildGraph['SETTLEMENTS'].append(vertex)
+        board.updateBoardGraph_settlement(vertex, player_i)
+    for vertex in case['cuts']:
+        opponent.buildGraph['SETTLEMENTS'].append(vertex)
+        board.updateBoardGraph_settlement(vertex, opponent)
+    for road in case['roads']:
+        player_i.buildGraph['ROADS'].append(road)
+        board.updateBoardGraph_road(road, player_i)
+
+    return board, player_i, opponent
+
+
+# Function to get the longest road by brute force - the longest trail from every vertex, straight from the rules:
+# no road used twice, and no passing through a vertex colonised by another player
+def brute_force_road_length(board, player_i):
+    topology = board.topology
+    roads = [edge for edge in range(topology.numEdges) if board.edgeOwner[edge] is player_i]
+
+    def longest_trail(vertex, usedRoads):
+        maxLength = 0
+        for edge in topology.vertexEdgeList[vertex]:
+            if edge in roads and edge not in usedRoads:
+                v1, v2 = topology.edgeVertexList[edge]
+                nextVertex = v2 if v1 == vertex else v1
+                length = 1
+                if board.vertexOwner[nextVertex] in [None, player_i]:
+                    length += longest_trail(nextVertex, usedRoads | {edge})
+                maxLength = max(maxLength, length)
+        return maxLength
+
+    return max([longest_trail(vertex, frozenset()) for vertex in range(topology.numVertices)], default=0)
+
+
+# The recursion player.get_road_length used before catanBoard.getRoadLength, kept as it was for comparison
+# Its visited lists are shared by sibling branches and never backtracked, so it can come up short
+def legacy_road_length(player_i, board):
+    roadLengths = []  # List to store road lengths from each starting edge
+    for edge in player_i.buildGraph['ROADS']:  # check for every starting edge
+        road = board.topology.edgeVertexList[edge]
+        # List to keep track of all lengths of roads resulting from this root road
+        player_i.road_i_lengths = []
+        legacy_check_path_length(player_i, road, [], 0, [], board)
+
+        road_inverted = (road[1], road[0])
+        legacy_check_path_length(player_i, road_inverted, [], 0, [], board)
+
+        # Update roadLength with max starting from this road
+        roadLengths.append(max(player_i.road_i_lengths))
+
+    return max(roadLengths)
+
+def legacy_check_path_length(player_i, edge, edgeList, roadLength, vertexList, board):
+    # Append current edge to list and increment road count
+    edgeList.append(edge)  # Append the road
+    roadLength += 1
+    vertexList.append(edge[0])  # Append the first vertex
+
+    # Get new neighboring forward edges from this edge - not visited by the search yet
+    road_neighbors_list = legacy_get_neighboring_roads(player_i, edge, board, edgeList, vertexList)
+
+    # if no neighboring roads exist append the roadLength upto this edge
+    if (road_neighbors_list == []):
+        player_i.road_i_lengths.append(roadLength)
+        return
+
+    # check paths from left and right neighbors separately
+    for neighbor_road in road_neighbors_list:
+        legacy_check_path_length(player_i, neighbor_road, edgeList, roadLength, vertexList, board)
+
+def legacy_get_neighboring_roads(player_i, road_i, board, visitedRoads, visitedVertices):
+    newNeighbors = []
+    # Use v1 and v2 to get the vertices to expand from
+    v1 = road_i[0]
+    v2 = road_i[1]
+    for edgeIndex in player_i.buildGraph['ROADS']:
+        edge = board.topology.edgeVertexList[edgeIndex]
+        if (edge[1] in visitedVertices):
+            # flip the edge if the orientation is reversed
+            edge = (edge[1], edge[0])
+
+        if (edge not in visitedRoads):  # If it is a new distinct edge
+            # Add condition for vertex to be not colonised by anyone else
+            if (board.vertexOwner[v2] in [player_i, None]):
+                if (edge[0] == v2 and edge[0] not in visitedVertices):
+                    newNeighbors.append(edge)
+                if (edge[0] == v1 and edge[0] not in visitedVertices):
+                    newNeighbors.append(edge)
+                if (edge[1] == v2 and edge[1] not in visitedVertices):
+                    newNeighbors.append((edge[1], edge[0]))
+                if (edge[1] == v1 and edge[1] not in visitedVertices):
+                    newNeighbors.append((edge[1], edge[0]))
+
+    return newNeighbors
+
+
+# Function to raise AssertionError with the formatted message unless condition holds - unlike assert, it still
+# checks under python -O
+def check(condition, message, *args):
+    if not condition:
+        raise AssertionError(message.format(*args))
+
+
+# Function to get the brute force road length with the given roads added
+def brute_force_length_with_roads(board, player_i, roads):
+    for road in roads:
+        board.apply(('ROAD', road, player_i))
+    length = brute_force_road_length(board, player_i)
+    for road in roads:
+        board.undo()
+    return length
+
+
+# Function to check every implementation against the brute force search on each case, raises AssertionError on the first
+# disagreement. Checks the full length, the cached length, the length with each buildable road added (one at a time and
+# in one batch), the batched lengths of the road sets the AI asks for (each road, the roads it opens up, and the
+# roads those open up), and the cached length after another player settles on each of the player's road vertices.
+# Returns the names of the cases where the legacy recursion comes up short
+def check_corpus(cases):
+    legacyShort = []
+    for case in cases:
+        board, player_i, opponent = build_case(case)
+        name = case['name']
+
+        expected = brute_force_road_length(board, player_i)
+        check(case['length'] in [None, expected], "{}: brute force gives {}, expected {}", name, expected, case['length'])
+        check(board.getRoadLength(player_i, board.roadMask[player_i]) == expected, "{}: trail search", name)
+        check(player_i.get_road_length(board) == expected, "{}: cached trail search", name)
+
+        legacyLength = legacy_road_length(player_i, board)
+        check(legacyLength <= expected, "{}: legacy recursion gives {}, longer than {}", name, legacyLength, expected)
+        if legacyLength < expected:
+            legacyShort.append(name)
+
+        # Every road the player could build next, alone and all together in one batch
+        candidates = list(board.get_potential_roads(player_i))
+        batchLengths = player_i.road_lengths_if_added(board, [[road] for road in candidates])
+        for road, batchLength in zip(candidates, batchLengths):
+            expectedWithRoad = brute_force_length_with_roads(board, player_i, [road])
+            check(player_i.road_length_if_added(board, road) == expectedWithRoad, "{}: road {} added", name, road)
+            check(batchLength == expectedWithRoad, "{}: road {} added in a batch", name, road)
+
+        # The multi road sets of dylanAIPlayer.get_road_sets, mixed with single roads in one batch as evaluate_roads does
+        roadSets = []
+        for road in candidates:
+            oneDegreeRoads = board.getNewPotentialRoads(player_i, [road])
+            roadSets += [[road], oneDegreeRoads, board.getNewPotentialRoads(player_i, oneDegreeRoads)]
+        for roads, batchLength in zip(roadSets, player_i.road_lengths_if_added(board, roadSets)):
+            check(batchLength == brute_force_length_with_roads(board, player_i, roads), "{}: roads {} added in a batch", name, roads)
+
+        # Settlements of another player that cut the network have to reach the cached lengths
+        for vertex in maskIndices(board.roadVertexMask[player_i] & ~board.occupiedMask):
+            board.apply(('SETTLEMENT', vertex, opponent))
+            expectedCut = brute_force_road_length(board, player_i)
+            check(player_i.get_road_length(board) == expectedCut, "{}: cut at vertex {}", name, vertex)
+            board.undo()
+            check(player_i.get_road_length(board) == expected, "{}: cut at vertex {} undone", name, vertex)
+
+    return legacyShort
+
+
+# Function to time the implementations on the corpus, in microseconds per case
+#   full length - brute force, legacy recursion and the board's trail search from scratch
+#   candidate roads - the road length with each buildable road added: applying each road and running the legacy
+#   recursion (what the AI used to do), road_length_if_added for each road, and road_lengths_if_added for all at once
+# Returns a dict of implementation name - microseconds per case
+def benchmark(cases, repeat=5):
+    boards = [build_case(case) for case in cases]
+    candidates = [list(board.get_potential_roads(player_i)) for board, player_i, opponent in boards]
+
+    def legacy_candidates(board, player_i, roads):
+        for road in roads:
+            board.apply(('ROAD', road, player_i))
+            legacy_road_length(player_i, board)
+            board.undo()
+
+    def incremental_candidates(board, player_i, roads):
+        board.roadNetworkCache.clear()  # Pay for the cache on every run, as after a road is built
+        for road in roads:
+            player_i.road_length_if_added(board, road)
+
+    def batched_candidates(board, player_i, roads):
+        board.roadNetworkCache.clear()
+        player_i.road_lengths_if_added(board, [[road] for road in roads])
+
+    implementations = {
+        'full length: brute force': lambda board, player_i, roads: brute_force_road_length(board, player_i),
+        'full length: legacy recursion': lambda board, player_i, roads: legacy_road_length(player_i, board),
+        'full length: trail search': lambda board, player_i, roads: board.getRoadLength(player_i, board.roadMask[player_i]),
+        'candidate roads: legacy recursion': legacy_candidates,
+        'candidate roads: road_length_if_added': incremental_candidates,
+        'candidate roads: road_lengths_if_added': batched_candidates,
+    }
+
+    times = {}
+    for implementationName, implementation in implementations.items():
+        bestTime = None
+        for i in range(repeat):
+            startTime = time.perf_counter()
+            for (board, player_i, opponent), roads in zip(boards, candidates):
+                implementation(board, player_i, roads)
+            runTime = time.perf_counter() - startTime
+            bestTime = runTime if bestTime is None else min(bestTime, runTime)
+        times[implementationName] = 1e6 * bestTime / max(len(cases), 1)
+
+    return times
@@ -0,0 +1,135 @@
+# Settlers of Catan
+# Batch simulation of headless AI-only games across a process pool
+
+from gameEngine import *
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import os
+
+# Player turns after which a game is stopped without a winner, so a stalled game can't hold up a batch
+default_max_turns = 1000
+
+
+# Function to get the seed of each game
+# seeds can be None (fresh entropy) or an int/SeedSequence root that is spawned into one independent
+# stream per game, or a list with the seed of each game
+def game_seeds(n_games, seeds=None):
+    if seeds is None or isinstance(seeds, (int, np.integer, np.random.SeedSequence)):
+        if not isinstance(seeds, np.random.SeedSequence):
+            seeds = np.random.SeedSequence(seeds)
+        return seeds.spawn(n_games)
+
+    seeds = list(seeds)
+    if len(seeds) != n_games:
+        raise ValueError("Got {} seeds for {} games".format(len(seeds), n_games))
+    return seeds
+
+
+# Function to get the dylanAIPlayer.updateAI keyword arguments of each seat
+# seats is the number of AI players, or a list with a dict of updateAI keyword arguments for each seat
+def seat_params(seats):
+    if isinstance(seats, (int, np.integer)):
+        seats = [{}] * seats
+
+    seats = [dict(params) for params in seats]
+    if not 1 <= len(seats) <= 4:
+        raise ValueError("Games are played with 1 to 4 seats, got {}".format(len(seats)))
+    return seats
+
+
+# Function to get the outcome of a finished game
+# winner, longestRoad and largestArmy are seats (None if nobody), victoryPoints has a breakdown for each seat
+def game_outcome(game, game_index, seed):
+    players = game.players
+
+    victoryPoints = []
+    for player_i in players:
+        victoryPoints.append({'total': player_i.victoryPoints,
+                              'settlements': len(player_i.buildGraph['SETTLEMENTS']),  # cities are taken off the settlement list
+                              'cities': 2 * len(player_i.buildGraph['CITIES']),
+                              'longestRoad': 2 if player_i.longestRoadFlag else 0,
+                              'largestArmy': 2 if player_i.largestArmyFlag else 0,
+                              'devCards': player_i.devCards['VP']})
+
+    longestRoad = [player_i.seat for player_i in players if player_i.longestRoadFlag]
+    largestArmy = [player_i.seat for player_i in players if player_i.largestArmyFlag]
+
+    return {'game': game_index,
+            'seed': seed,
+            'winner': game.winner.seat if game.winner is not None else None,
+            'turns': game.turnCount,
+            'victoryPoints': victoryPoints,
+            'longestRoad': longestRoad[0] if longestRoad else None,
+            'largestArmy': largestArmy[0] if largestArmy else None}
+
+
+# Function to play one game in a worker process - takes (game index, seed, seat params, max turns, max points)
+def play_game(task):
+    game_index, seed, ai_params, max_turns, max_points = task
+
+    game = catanGameEngine(numPlayers=len(ai_params), seed=seed, maxPoints=max_points, aiParams=ai_params)
+    game.playCatan(maxTurns=max_turns)
+
+    return game_outcome(game, game_index, seed)
+
+
+# Function to play game tasks (see play_game) on a pool of workers and return their outcomes, in task order
+# workers defaults to the number of cores, and workers=1 plays every game in this process.
+# Games are sent to the workers in chunks of chunksize
+def run_games(tasks, workers=None, chunksize=None):
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(tasks) <= 1:
+        return [play_game(task) for task in tasks]
+
+    # A few chunks per worker balances uneven game lengths without sending games one at a time
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+        return list(executor.map(play_game, tasks, chunksize=chunksize))
+
+
+# Function to play n_games AI-only games and return the outcome of each, in game order
+# seats and seeds are described in seat_params and game_seeds, workers and chunksize in run_games
+def simulate(n_games, seats=4, seeds=None, workers=None, max_turns=default_max_turns, max_points=10, chunksize=None):
+    ai_params = seat_params(seats)
+    tasks = [(game_index, seed, ai_params, max_turns, max_points)
+             for game_index, seed in enumerate(game_seeds(n_games, seeds))]
+
+    return run_games(tasks, workers, chunksize)
+
+
+# Function to play n_games between AI contenders, each a dict of updateAI keyword arguments
+# Seat s of game g is played by contender (s + g) % len(contenders), so every contender rotates through every seat
+# Each outcome also has the contender index of each seat under 'contenders'
+def tournament(n_games, contenders, n_seats=4, seeds=None, workers=None, max_turns=default_max_turns, max_points=10, chunksize=None):
+    contenders = [dict(params) for params in contenders]
+    if not contenders:
+        raise ValueError("A tournament needs at least one contender")
+    seat_params(n_seats)
+
+    tasks = []
+    seatContenders = []
+    for game_index, seed in enumerate(game_seeds(n_games, seeds)):
+        seatContenders.append([(seat + game_index) % len(contenders) for seat in range(n_seats)])
+        tasks.append((game_index, seed, [contenders[c] for c in seatContenders[-1]], max_turns, max_points))
+
+    outcomes = run_games(tasks, workers, chunksize)
+    for outcome, gameContenders in zip(outcomes, seatContenders):
+        outcome['contenders'] = gameContenders
+    return outcomes
+
+
+# Functions to write game seeds to JSON and read them back, so a game can be replayed from its outcome
+# Spawned seeds are written as {"entropy": ..., "spawn_key": [...]}
+def seed_to_json(seed):
+    if isinstance(seed, np.random.SeedSequence):
+        return {'entropy': seed.entropy, 'spawn_key': list(seed.spawn_key)}
+    return int(seed)
+
+def seed_from_json(value):
+    if isinstance(value, dict):
+        return np.random.SeedSequence(value['entropy'], spawn_key=tuple(value['spawn_key']))
+    return int(value)
@@ -0,0 +1,23 @@
+# Settlers of Catan
+# Tests for the board's apply/undo journal - run from this folder with python -m pytest
+
+from board import *
+from player import player
+
+
+def test_undo_restores_production_index():
+    board = catanBoard(seed=0)
+    fresh = catanBoard(seed=0)
+    player_i = player('Player', 'black', 10, seat=0)
+
+    vertex = board.topology.hexVertexList[0][0]
+    board.apply(('SETTLEMENT', vertex, player_i))
+    board.apply(('CITY', vertex, player_i))
+    board.apply(('ROBBER', board.topology.vertexHexList[vertex][-1], None))
+    assert board.hexProduction != fresh.hexProduction
+
+    for i in range(3):
+        board.undo()
+    assert board.hexProduction == fresh.hexProduction
+    assert board.rollProduction == fresh.rollProduction
+    assert board.robberHex == fresh.robberHex
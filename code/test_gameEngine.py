@@ -0,0 +1,79 @@
+# Settlers of Catan
+# Tests for the longest road bookkeeping and position hash of the game engine - run from this folder with python -m pytest
+
+from gameEngine import *
+
+
+# Function to get a game with plain players of the given road lengths, without setting up the board
+def make_game(roadLengths):
+    game = catanGameEngine(numPlayers=len(roadLengths), seed=1)
+    game.players = [player('P{}'.format(i + 1), 'black', 10, seat=i) for i in range(len(roadLengths))]
+    for player_i, roadLength in zip(game.players, roadLengths):
+        player_i.maxRoadLength = roadLength
+    return game
+
+
+# Function to get a game where H held longest road until a cut left A and B tied at 7, so the card is set aside
+def make_tied_game():
+    game = make_game([9, 7, 7])
+    H, A, B = game.players
+    for player_i in game.players:
+        game.check_longest_road(player_i)
+    assert game.longestRoadHolder is H
+
+    H.maxRoadLength = 3  # An opponent settlement cuts H's road
+    game.check_longest_road(A)
+    return game
+
+
+def test_tie_after_cut_sets_card_aside():
+    game = make_tied_game()
+    H, A, B = game.players
+
+    assert game.longestRoadHolder is None
+    assert game.longestRoadLength == 7
+    assert not any(player_i.longestRoadFlag for player_i in game.players)
+    assert H.victoryPoints == 0 and H.visibleVictoryPoints == 0
+
+
+def test_cut_breaking_the_tie_gives_card_to_remaining_player():
+    game = make_tied_game()
+    H, A, B = game.players
+
+    A.maxRoadLength = 5  # A is cut too, B is left alone with 7
+    game.check_longest_road(H)
+
+    assert game.longestRoadHolder is B
+    assert B.longestRoadFlag and not A.longestRoadFlag
+    assert B.victoryPoints == 2 and B.visibleVictoryPoints == 2
+    assert game.longestRoadLength == 7
+
+
+def test_card_stays_aside_while_tied():
+    game = make_tied_game()
+    H, A, B = game.players
+
+    A.maxRoadLength = 6  # Both cut to the same length
+    B.maxRoadLength = 6
+    game.check_longest_road(A)
+    assert game.longestRoadHolder is None
+    assert game.longestRoadLength == 6
+
+    B.maxRoadLength = 7  # A longer road than the tied ones takes it
+    game.check_longest_road(B)
+    assert game.longestRoadHolder is B
+    assert B.victoryPoints == 2
+
+
+def test_position_hash_covers_dev_cards_bought_this_turn():
+    knightGame, monopolyGame, heldGame = make_game([0, 0]), make_game([0, 0]), make_game([0, 0])
+    knightGame.players[0].newDevCards['KNIGHT'] += 1
+    monopolyGame.players[0].newDevCards['MONOPOLY'] += 1
+    heldGame.players[0].devCards['KNIGHT'] += 1
+
+    assert knightGame.get_position_hash() != monopolyGame.get_position_hash()
+    assert knightGame.get_position_hash() != heldGame.get_position_hash()
+
+    knightGame.players[0].updateDevCards()  # The knight can be played from the next turn on
+    assert knightGame.get_position_hash() == heldGame.get_position_hash()
+    assert knightGame.players[0].devCards['KNIGHT'] == 1 and sum(knightGame.players[0].newDevCards.values()) == 0
@@ -0,0 +1,12 @@
+# Settlers of Catan
+# Tests of the longest road search against the brute force search - run from this folder with python -m pytest
+
+from roadBenchmark import *
+
+
+def test_adversarial_corpus():
+    check_corpus(adversarial_cases())
+
+
+def test_random_corpus():
+    check_corpus(random_cases(50, seed=1))
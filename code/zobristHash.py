@@ -0,0 +1,49 @@
+#Settlers of Catan
+#Zobrist hashing of game positions - no pygame needed
+
+import numpy as np
+from boardTopology import *
+
+#Largest number of players with their own keys, and card counts with their own key per card type
+#Larger counts wrap around, so they can collide but still hash consistently
+maxSeats = 8
+maxCardCount = 64
+
+resourceNames = ('ORE', 'BRICK', 'WHEAT', 'WOOD', 'SHEEP')
+devCardNames = ('KNIGHT', 'VP', 'MONOPOLY', 'ROADBUILDER', 'YEAROFPLENTY')
+
+#Function to get a nested list of random 64 bit keys with the given shape
+#The keys come from a fixed seed so hashes can be compared across games and processes
+def zobrist_keys(rng, *shape):
+    return rng.integers(0, 2**63, size=shape, dtype=np.int64).tolist()
+
+zobristRng = np.random.default_rng(0x5A0B1257)
+robberKeys = zobrist_keys(zobristRng, standardTopology.numHexes) #Robber on each hex
+buildingKeys = zobrist_keys(zobristRng, maxSeats, 3, standardTopology.numVertices) #By seat, building type (1 - settlement, 2 - city) and vertex
+roadKeys = zobrist_keys(zobristRng, maxSeats, standardTopology.numEdges) #By seat and edge
+cardKeys = [{card: tuple(zobrist_keys(zobristRng, maxCardCount)) for card in resourceNames + devCardNames} for seat in range(maxSeats)] #By seat, card type and count
+newCardKeys = [{card: tuple(zobrist_keys(zobristRng, maxCardCount)) for card in devCardNames} for seat in range(maxSeats)] #Dev cards bought this turn, by seat, card type and count
+
+
+#Class for a dict of card counts that keeps the Zobrist hash of its counts up to date on every assignment
+#Used for player resources and dev cards (playable and bought this turn), so hands[card] += 1 anywhere updates the hash in O(1)
+class handDict(dict):
+    'Class Definition for a Hashed Hand of Cards'
+    def __init__(self, counts, seatKeys):
+        dict.__init__(self, counts)
+        self.seatKeys = seatKeys #Dict of card - key for each count, for the seat of the player holding this hand
+        self.zobristHash = 0
+        for card, count in self.items():
+            self.zobristHash ^= seatKeys[card][count % maxCardCount]
+
+    def __setitem__(self, card, count):
+        keys = self.seatKeys[card]
+        self.zobristHash ^= keys[self[card] % maxCardCount] ^ keys[count % maxCardCount]
+        dict.__setitem__(self, card, count)
+
+    #Copies keep hashing with the same keys, without copying the key tables
+    def __deepcopy__(self, memo):
+        return handDict(self, self.seatKeys)
+
+    def __reduce__(self):
+        return (handDict, (dict(self), self.seatKeys))